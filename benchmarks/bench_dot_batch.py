@@ -0,0 +1,77 @@
+"""
+Draw cost of 1k particle sized dots per frame: one pg.draw.circle call per dot (as before
+the dot batch) versus queueing them in a DotBatch and flushing it with one Surface.blits call, both
+one dot at a time (add) and per color and radius group (add_many, as the particle buffer and
+the bullets do).
+
+Run from the repository root:
+    python -m benchmarks.bench_dot_batch
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from random import uniform, randint, choice
+from timeit import timeit
+import numpy as np
+import pygame as pg
+from utils import DotBatch, dirty_rects, WHITE, YELLOW, RED, BULLET_SIZE
+
+DOTS = 1000
+FRAMES = 50
+COLORS = (WHITE, YELLOW, RED)
+
+
+def make_dots(count) -> list:
+    """(x, y, radius, color): a few bullet sized dots, the rest particle sized (see ParticleExplosionAnimation)."""
+    return [
+        (uniform(0, 800), uniform(0, 600), BULLET_SIZE if i % 10 == 0 else randint(2, 5), choice(COLORS))
+        for i in range(count)
+    ]
+
+
+def main():
+    pg.init()
+    screen = pg.display.set_mode((800, 600))
+    dots = make_dots(DOTS)
+    batch = DotBatch()
+
+    def draw():
+        for x, y, radius, color in dots:
+            dirty_rects.add(pg.draw.circle(screen, color, (x, y), radius))
+
+    groups = {} # (radius, color) -> (xs, ys), as the particle buffer hands them over
+    for x, y, radius, color in dots:
+        xs, ys = groups.setdefault((radius, color), ([], []))
+        xs.append(x)
+        ys.append(y)
+    groups = {key: (np.array(xs), np.array(ys)) for key, (xs, ys) in groups.items()}
+
+    def batched():
+        add = batch.add
+        for x, y, radius, color in dots:
+            add(x, y, radius, color)
+        batch.flush(screen)
+
+    def batched_many():
+        for (radius, color), (xs, ys) in groups.items():
+            batch.add_many(xs, ys, radius, color)
+        batch.flush(screen)
+
+    print(f"{DOTS} dots per frame, {FRAMES} frames, ms per frame:")
+    for enabled in (False, True):
+        dirty_rects.enabled = enabled
+        batched() # warm the sprites
+        drawn = timeit(draw, number=FRAMES) / FRAMES
+        added = timeit(batched, number=FRAMES) / FRAMES
+        added_many = timeit(batched_many, number=FRAMES) / FRAMES
+        dirty_rects.current.clear()
+        label = "dirty rects" if enabled else "full frame "
+        print(
+            f"  {label}   draw.circle {drawn*1e3:5.2f}   add+flush {added*1e3:5.2f} ({drawn/added:.2f}x)"
+            f"   add_many+flush {added_many*1e3:5.2f} ({drawn/added_many:.2f}x)"
+        )
+    print(batch.stats())
+
+
+if __name__ == "__main__":
+    main()
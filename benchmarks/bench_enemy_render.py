@@ -0,0 +1,67 @@
+"""
+Render cost per enemy spaceship: vertices from 16 trig calls per frame (as before the shared
+per-size template) versus EnemySpaceshipPolygon.render with the template.
+
+Run from the repository root:
+    python -m benchmarks.bench_enemy_render
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from math import cos, sin, pi
+from random import uniform
+from timeit import timeit
+import pygame as pg
+from utils import EnemySpaceshipPolygon, BIG_ENEMY_SSHIP_SIZE, SMALL_ENEMY_SSHIP_SIZE, RED
+
+SHIP_COUNT = 200
+FRAMES = 100
+# (radius factor, angle) of the 8 distinct vertices, and the order in which they are drawn
+SHAPE = ((.9, 350), (.6, 315), (1, 270), (.8, 225), (.9, 10), (.6, 45), (1, 90), (.8, 135))
+DRAW_ORDER = (0, 1, 5, 1, 2, 6, 2, 3, 7, 6, 5, 4)
+
+
+def trig_vertices(polygon) -> list:
+    """Per-frame vertex computation as it was: two trig calls for each of the 8 distinct vertices."""
+    vertices = [
+        (polygon.center_x + polygon.size * factor * cos(pi / 180 * (angle - 90)),
+         polygon.center_y + polygon.size * factor * sin(pi / 180 * (angle - 90)))
+        for factor, angle in SHAPE
+    ]
+    return [vertices[i] for i in DRAW_ORDER]
+
+
+def main():
+    pg.init()
+    surface = pg.Surface((800, 600))
+    ships = [
+        EnemySpaceshipPolygon(uniform(50, 750), uniform(50, 550), RED, 3, BIG_ENEMY_SSHIP_SIZE if i % 2 else SMALL_ENEMY_SSHIP_SIZE)
+        for i in range(SHIP_COUNT)
+    ]
+
+    def render_trig():
+        for ship in ships:
+            pg.draw.polygon(surface, ship.color, trig_vertices(ship), ship.width)
+
+    def render_template():
+        for ship in ships:
+            ship.render(surface)
+
+    def vertices_trig():
+        for ship in ships:
+            trig_vertices(ship)
+
+    def vertices_template():
+        for ship in ships:
+            ship.vertices
+
+    calls = SHIP_COUNT * FRAMES
+    print(f"per enemy spaceship, {SHIP_COUNT} ships x {FRAMES} frames:")
+    for label, before, after in (("vertices", vertices_trig, vertices_template), ("render", render_trig, render_template)):
+        trig = timeit(before, number=FRAMES) / calls
+        template = timeit(after, number=FRAMES) / calls
+        print(f"  {label:<9} trig {trig*1e6:6.2f} us   template {template*1e6:6.2f} us   ({trig/template:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
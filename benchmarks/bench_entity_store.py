@@ -0,0 +1,52 @@
+"""
+Per-tick cost of moving and despawn-checking asteroids and bullets:
+one Python call per object versus a single EntityStore.step.
+
+Run from the repository root:
+    python -m benchmarks.bench_entity_store
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from random import uniform
+from timeit import timeit
+from entities import Asteroid, UserBullet, SpaceEntity
+from utils import WHITE, EntityStore
+
+ENTITY_COUNTS = (100, 1000, 10000)
+TICKS = 50
+
+
+def make_entities(n) -> list:
+    # slow movers in the middle of the screen with long lifetimes, so nothing despawns mid-benchmark
+    width, height = SpaceEntity.x_scrnsize(), SpaceEntity.y_scrnsize()
+    entities = []
+    for i in range(n):
+        x, y, direction = uniform(width/4, width*3/4), uniform(height/4, height*3/4), uniform(0, 360)
+        if i % 2:
+            entities.append(Asteroid(x, y, 40, direction, WHITE, speed=0.01))
+        else:
+            entities.append(UserBullet(x, y, 3, 0.01, direction, WHITE, lifetime=10**9))
+    return entities
+
+
+def per_object_tick(entities):
+    for entity in entities:
+        entity.move()
+        entity.should_despawn()
+
+
+def main():
+    width, height = SpaceEntity.x_scrnsize(), SpaceEntity.y_scrnsize()
+    print(f"{'entities':>10} {'per-object (us/tick)':>22} {'EntityStore (us/tick)':>22} {'speedup':>8}")
+    for n in ENTITY_COUNTS:
+        entities = make_entities(n)
+        per_object = timeit(lambda: per_object_tick(entities), number=TICKS) / TICKS
+        store = EntityStore()
+        store.attach_many(entities)
+        vectorized = timeit(lambda: store.step(width, height), number=TICKS) / TICKS
+        print(f"{n:>10} {per_object*1e6:>22.1f} {vectorized*1e6:>22.1f} {per_object/vectorized:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Draw cost per polygon: pg.draw.polygon on freshly translated vertices (as before the sprite cache)
+versus Polygon.render blitting the cached outline sprite, and how many sprites stay cached while
+polygons are reshaped (as recycled asteroids are).
+
+Run from the repository root:
+    python -m benchmarks.bench_sprite_cache
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from random import uniform, randint
+from timeit import timeit
+import pygame as pg
+from utils import RandomPolygon, UserSpaceshipPolygon, EnemySpaceshipPolygon, sprite_cache, WHITE, YELLOW, RED, BIG_ENEMY_SSHIP_SIZE
+
+COUNTS = (100, 500)
+FRAMES = 50
+
+
+def make_polygons(count) -> list:
+    polygons = []
+    for i in range(count):
+        x, y = uniform(50, 750), uniform(50, 550)
+        if i % 10 == 0:
+            polygons.append(UserSpaceshipPolygon(x, y, WHITE, 3, 20, randint(0, 79) * 4.5))
+        elif i % 10 == 1:
+            polygons.append(EnemySpaceshipPolygon(x, y, RED, 3, BIG_ENEMY_SSHIP_SIZE))
+        else:
+            size, sides = randint(10, 50), randint(7, 12)
+            polygons.append(RandomPolygon(x, y, size, sides, YELLOW, 3, [uniform(size * .5, size * 1.5) for _ in range(sides)]))
+    return polygons
+
+
+def main():
+    pg.init()
+    screen = pg.display.set_mode((800, 600))
+    print(f"per polygon, {FRAMES} frames:")
+    for count in COUNTS:
+        polygons = make_polygons(count)
+
+        def draw():
+            for polygon in polygons:
+                pg.draw.polygon(screen, polygon.color, polygon.vertices, polygon.width)
+
+        def blit():
+            for polygon in polygons:
+                polygon.render(screen)
+
+        blit() # warm the cache
+        calls = count * FRAMES
+        drawn = timeit(draw, number=FRAMES) / calls
+        blitted = timeit(blit, number=FRAMES) / calls
+        print(f"  {count:>4} polygons   draw {drawn*1e6:6.2f} us   sprite {blitted*1e6:6.2f} us   ({drawn/blitted:.2f}x)")
+    print(sprite_cache.stats())
+
+    # recycled asteroids: reshaping drops the old shape's sprite, so the cache follows the live shapes
+    sprite_cache.clear()
+    polygons = [polygon for polygon in make_polygons(COUNTS[-1]) if isinstance(polygon, RandomPolygon)]
+    for _ in range(FRAMES):
+        for polygon in polygons:
+            size = randint(10, 50)
+            polygon.reshape(polygon.center_x, polygon.center_y, size, polygon.color, [uniform(size * .5, size * 1.5) for _ in range(polygon.sides)])
+            polygon.render(screen)
+    print(f"after {FRAMES} reshapes of {len(polygons)} polygons: {len(sprite_cache)} sprites cached, {sprite_cache.stats()['evictions']} evictions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Asteroid move loop with per-tick trig (the old Asteroid.move) versus the cached (vx, vy) on SpaceEntity.
+
+Run from the repository root:
+    python -m benchmarks.bench_velocity_cache
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from math import cos, sin, pi
+from random import uniform
+from timeit import timeit
+from entities import Asteroid
+from utils import WHITE
+
+ASTEROID_COUNT = 1000
+TICKS = 200
+
+
+def trig_move(asteroid):
+    """Asteroid.move as it was before velocities were cached."""
+    dx = asteroid.speed * cos(asteroid.direction * pi / 180)
+    dy = asteroid.speed * sin(asteroid.direction * pi / 180)
+    asteroid.x += dx
+    asteroid.y += dy
+    asteroid.polygon.move(dx, dy)
+
+
+def main():
+    asteroids = [Asteroid(uniform(0, 800), uniform(0, 600), 40, uniform(0, 360), WHITE) for _ in range(ASTEROID_COUNT)]
+
+    def trig_loop():
+        for asteroid in asteroids:
+            trig_move(asteroid)
+
+    def cached_loop():
+        for asteroid in asteroids:
+            asteroid.move()
+
+    trig = timeit(trig_loop, number=TICKS) / TICKS
+    cached = timeit(cached_loop, number=TICKS) / TICKS
+    print(f"{ASTEROID_COUNT} asteroids, per tick:")
+    print(f"  trig every move:  {trig*1e6:8.1f} us")
+    print(f"  cached velocity:  {cached*1e6:8.1f} us ({trig/cached:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
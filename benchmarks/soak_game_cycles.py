@@ -0,0 +1,107 @@
+"""
+Regression soak for TimeManager leaks.
+
+Timers: 10k rounds of what used to leak timers without a LevelManager.clear_instances in between.
+Each round makes a user spaceship, destroys it (which replaces its invulnerability timer) and drops
+a LevelSoundManager right away. While the spaceships are kept, TimeManager.instances must hold
+only their live timers; once they're dropped it must shrink back to where it started.
+
+Games: 10k start / pause / reset cycles, checking traced memory and live timers stay flat after
+warm-up.
+
+Exits with status 1 if either check fails.
+
+Run from the repository root:
+    python -m benchmarks.soak_game_cycles
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import gc
+import tracemalloc
+from contextlib import redirect_stdout
+from engine.game_state import GameState, asset_manager, screen
+from entities import UserSpaceship
+from sounds import LevelSoundManager
+from utils import TimeManager, SPACESHIP_STARTING_LIVES, INITIAL_LEVEL_DURATION, WHITE
+
+CYCLES = 10_000
+WARMUP = 500
+REPORT_EVERY = 2_000
+MAX_GROWTH = 256 * 1024 # bytes of traced memory allowed to appear after warm-up
+
+
+def live_timers() -> int:
+    gc.collect()
+    return len(TimeManager.instances)
+
+
+def soak_timers() -> bool:
+    baseline = live_timers()
+    spaceships = []
+    print(f"timers: {'round':>7} {'spaceships':>10} {'timers':>7}")
+    for i in range(1, CYCLES + 1):
+        spaceship = UserSpaceship(400, 300, 20, 0, 0, WHITE, screen, None)
+        spaceship.destroy()
+        LevelSoundManager(asset_manager, INITIAL_LEVEL_DURATION)
+        spaceships.append(spaceship)
+        if i % REPORT_EVERY == 0:
+            print(f"        {i:>7} {len(spaceships):>10} {live_timers():>7}")
+    del spaceship
+    held = live_timers()
+    spaceships.clear()
+    released = live_timers()
+    print(f"        dropped the spaceships: {held} -> {released} timers (started at {baseline})")
+    # one live invulnerability timer per spaceship held, none left over once they're gone
+    if held > baseline + CYCLES or released > baseline:
+        print("FAIL: TimeManager.instances kept timers their owners dropped")
+        return False
+    return True
+
+
+def cycle(game_state):
+    game_state.start_game()
+    game_state.handle_events()
+    game_state.update_game()
+    game_state.pause_game()
+    game_state.reset_game() # resets while paused
+
+
+def soak_games(game_state) -> bool:
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull): # start / pause / end print every cycle
+        for _ in range(WARMUP):
+            cycle(game_state)
+    tracemalloc.start()
+    baseline_timers = live_timers()
+    baseline_bytes = tracemalloc.get_traced_memory()[0]
+    print(f"games:  {'cycle':>7} {'traced KB':>10} {'timers':>7}")
+    with open(os.devnull, "w") as devnull:
+        for i in range(WARMUP + 1, CYCLES + 1):
+            with redirect_stdout(devnull):
+                cycle(game_state)
+            if i % REPORT_EVERY == 0:
+                timers = live_timers()
+                print(f"        {i:>7} {(tracemalloc.get_traced_memory()[0] - baseline_bytes) / 1024:>10.1f} {timers:>7}")
+    timers = live_timers()
+    growth = tracemalloc.get_traced_memory()[0] - baseline_bytes
+    tracemalloc.stop()
+    print(f"        grew {growth / 1024:.1f} KB over {CYCLES - WARMUP} cycles, {timers} live timers (started at {baseline_timers})")
+    if growth > MAX_GROWTH or timers > baseline_timers:
+        print("FAIL: memory or live timers grew across games")
+        return False
+    return True
+
+
+def main():
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        game_state = GameState(lives=SPACESHIP_STARTING_LIVES)
+    timers_ok = soak_timers()
+    games_ok = soak_games(game_state)
+    if not (timers_ok and games_ok):
+        raise SystemExit(1)
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
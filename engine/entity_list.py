@@ -0,0 +1,57 @@
+class EntityList:
+    """
+    Container of live entities with O(1) removal.
+
+    Removing an entity only flags it dead (entity.alive = False) so it is skipped from then on;
+    compact() drops every dead entry in a single pass at the end of the tick.
+    """
+    def __init__(self):
+        self.items = []
+        self.dead_count = 0
+
+    def __len__(self):
+        return len(self.items) - self.dead_count
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __iter__(self):
+        """
+        Iterate over the live entities.
+        Entities appended while iterating are picked up by the next pass, so callers don't need a copy.
+        """
+        items = self.items
+        for i in range(len(items)):
+            entity = items[i]
+            if entity.alive:
+                yield entity
+
+    def append(self, entity):
+        entity.alive = True
+        self.items.append(entity)
+
+    def discard(self, entity) -> bool:
+        """Flag an entity as dead. Returns False if it was already removed."""
+        if not entity.alive:
+            return False
+        entity.alive = False
+        self.dead_count += 1
+        return True
+
+    def compact(self) -> list:
+        """Drop dead entities, keeping the order of the rest. Returns the dropped entities."""
+        if not self.dead_count:
+            return []
+        removed = [entity for entity in self.items if not entity.alive]
+        self.items = [entity for entity in self.items if entity.alive]
+        self.dead_count = 0
+        return removed
+
+    def clear(self) -> list:
+        """Remove every entity, including dead ones not compacted yet. Returns the removed entities."""
+        removed = self.items
+        for entity in removed:
+            entity.alive = False
+        self.items = []
+        self.dead_count = 0
+        return removed
@@ -1,12 +1,12 @@
 import pygame as pg
-from graphics import Display, AnimationManager, ParticleExplosionAnimation, UserSpaceshipDeathAnimation, RenderManager, DisplaySpaceshipLives
+from graphics import Display, AnimationManager, ParticleExplosionAnimation, UserSpaceshipDeathAnimation, RenderManager, DisplaySpaceshipLives, layout
 from .object_manager import ObjectManager
 from entities import UserSpaceship, Asteroid, Bullet, UserBullet, EnemyBullet, EnemySpaceship
 from .high_scores_manager import HighScoresManager
 from .level_manager import LevelManager
 from sounds import SoundManager
 WAIT_AFTER_ENTERING_INITIALS_TIME = 1000
-from utils import AssetManager, is_mouse_pressed, check_quit, choose_color, X_SCRNSIZE, Y_SCRNSIZE, WHITE, BULLET_SPEED, KeysManager, SSHIP_DESTRUCTION_DURATION, LEFT_CLICK, MAX_X_SCRNSIZE, MAX_Y_SCRNSIZE, TimeManager, is_key_pressed, WAIT_AFTER_ENTERING_INITIALS_TIME, INVULNERABLE_TIME, BULLET_SIZE, direction_overlap
+from utils import AssetManager, is_mouse_pressed, check_quit, choose_color, X_SCRNSIZE, Y_SCRNSIZE, WHITE, BULLET_SPEED, KeysManager, SSHIP_DESTRUCTION_DURATION, LEFT_CLICK, MAX_X_SCRNSIZE, MAX_Y_SCRNSIZE, TimeManager, is_key_pressed, WAIT_AFTER_ENTERING_INITIALS_TIME, INVULNERABLE_TIME, BULLET_SIZE, direction_overlap, sprite_cache, dirty_rects, viewport, dot_batch, frame_clock
 
 # INITIALIZE OBJECTS
 high_scores_manager = HighScoresManager()
@@ -15,6 +15,7 @@ object_manager = ObjectManager()
 animation_manager = AnimationManager()
 keys_manager = KeysManager()
 screen = pg.display.set_mode((X_SCRNSIZE, Y_SCRNSIZE))
+viewport.update()
 display = Display(screen, asset_manager)  # UI manager
 render_manager = RenderManager()
 sound_manager = SoundManager(asset_manager)  
@@ -40,6 +41,9 @@ class GameState:
         self.last_high_score_initials = None
         self.delay_trans_tm = None # will be init'ed to be a TimeManager that delays the transition away from the new_high_score state so you can see the initials you entered for a sec
         self.allow_lose_life = False
+        self.rendered_state = None # state drawn last frame; a state change redraws the whole screen in dirty-rect mode
+        self.rendered_high_scores_version = high_scores_manager.version
+        self.init_layers_to_render()
 
 
     @property
@@ -61,19 +65,11 @@ class GameState:
     
     @property
     def x_scrnsize(self):
-        try:
-            x, _ = pg.display.get_window_size()
-            return x
-        except pg.error as e:
-            return X_SCRNSIZE
+        return viewport.width
     
     @property
     def y_scrnsize(self):
-        try:
-            _, y = pg.display.get_window_size()
-            return y
-        except pg.error as e:
-            return Y_SCRNSIZE 
+        return viewport.height
         
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode."""
@@ -83,6 +79,16 @@ class GameState:
         else:
             screen = pg.display.set_mode((MAX_X_SCRNSIZE, MAX_Y_SCRNSIZE), pg.FULLSCREEN)
             self.fullscreen = True
+        # the size may not change, but sprites were converted to the old display's pixel format either way
+        viewport.update()
+        self.invalidate_render_caches()
+
+    def invalidate_render_caches(self):
+        """Drop everything rasterized for the old window size or display, on any resize or mode change."""
+        sprite_cache.clear()
+        dirty_rects.invalidate()
+        display.invalidate_panels()
+        layout.refresh()
 
     def hide_cursor_while_playing(self):
         if self.state == "playing":
@@ -92,6 +98,10 @@ class GameState:
 
     def handle_events(self):
         """Process input and update the state accordingly."""
+        frame_clock.tick() # the frame's one time sample; every TimeManager reads it
+        # the one window-size query of the frame; everything else reads viewport
+        if viewport.update():
+            self.invalidate_render_caches()
         for event in pg.event.get():
             if check_quit(event):
                 self.state = "exit"
@@ -164,6 +174,7 @@ class GameState:
                     + len(object_manager.get_object_list2('enemy_spaceships'))
                 )
                 self.lose_life_after_destruction()
+            object_manager.compact_obj_lists()
 
     def add_enemies(self): # TODO: incorporate generation based on level
         """
@@ -234,64 +245,81 @@ class GameState:
             self.level_manager.play_level_sound()
     
     def render_game(self):
-        self.init_layers_to_render()
+        if self.state != self.rendered_state or self.rendered_high_scores_version != high_scores_manager.version:
+            dirty_rects.invalidate()
+            display.invalidate_panels()
+            self.rendered_state = self.state
+            self.rendered_high_scores_version = high_scores_manager.version
         render_manager.render(screen, self.state)  # Pass the current game state
-        pg.display.update()
+        dirty_rects.end_frame(screen) # pg.display.update, restricted to the dirty rects in dirty-rect mode
 
     def init_layers_to_render(self):
-        render_manager.layers = []
+        """Build the render graph. Called once: layers look up whatever they draw when they render."""
+        render_manager.clear()
         # Add a background layer (visible in all states)
         render_manager.add_layer(
             lambda screen: display.render(),
-            z_index=0
+            z_index=0,
+            name="background"
         )
         # Add the next LEVEL indicator (displays the 'LEVEL <1>' text at start of each new level)
         render_manager.add_layer(
             lambda screen: display.render_new_level(self.current_level, self.level_manager.display_new_level, self.level_manager.get_level_color_counter()),
             z_index=1,
-            states=["playing", "paused"]
+            states=["playing", "paused"],
+            name="new_level"
         )
         # Add a game objects layer (only in 'playing' state)
         render_manager.add_layer(
             lambda screen: object_manager.render_objects(screen),
             z_index=2,
             # states=["playing"]
+            name="objects"
         )
         # Add an animation layer (only in 'playing' state)
         render_manager.add_layer(
             lambda screen: animation_manager.render_animations(screen),
             z_index=3,
             # states=["playing"]
+            name="animations"
+        )
+        # Draw the particles queued by the animations layer in one batch
+        render_manager.add_layer(
+            lambda screen: dot_batch.flush(screen),
+            z_index=3,
+            name="dots"
         )
         # Add a HUD layer (only in 'playing' state)
         render_manager.add_layer(
             lambda screen: display.render_hud(self.points, self.lives),
             z_index=4,
-            states=["playing", "paused"]
+            states=["playing", "paused"],
+            name="hud"
         )
-        usship = object_manager.get_user_spaceship()
         # Add a menu layer (only in 'menu' state)
         render_manager.add_layer(
             lambda screen: display.render_title_screen(
                 self.get_high_score('points'), 
                 self.get_high_score('level')),
             z_index=4,
-            states=["title_menu"]
+            states=["title_menu"],
+            name="title_menu"
         )
         # Add a paused layer (only in 'paused' state)
         render_manager.add_layer(
             lambda screen: display.render_paused(),
             z_index=4,
-            states=["paused"]
+            states=["paused"],
+            name="paused"
         )
-        sship = object_manager.get_user_spaceship()
         render_manager.add_layer(
             lambda screen: display.render_game_over(
-                sship.delay_game_over_display,
+                object_manager.get_user_spaceship().delay_game_over_display,
                 self.points
                 ),
             z_index=4,
-            states=["game_over"]
+            states=["game_over"],
+            name="game_over"
         ) # where to handle exiting this phase if timer runs out?
         render_manager.add_layer(
             lambda screen: display.render_game_over_menu(
@@ -301,7 +329,8 @@ class GameState:
                 self.get_high_score('level'),
             ), 
             z_index=4,
-            states=["game_over_menu"]
+            states=["game_over_menu"],
+            name="game_over_menu"
         )
         render_manager.add_layer(
             lambda screen: display.render_new_high_score(
@@ -310,7 +339,8 @@ class GameState:
                 self.initials
             ),
             z_index=4,
-            states=["new_high_score"]
+            states=["new_high_score"],
+            name="new_high_score"
         )
     
     def is_high_score(self):
@@ -328,6 +358,7 @@ class GameState:
         self.points = 0
         print("Game started.")
         object_manager.wipe_obj_lists()
+        animation_manager.clear() # explosions from the last game shouldn't carry over
         object_manager.add_object(UserSpaceship(
             self.x_scrnsize/2, 
             self.y_scrnsize/2, 
@@ -344,7 +375,7 @@ class GameState:
         sship.lost_all_lives = False
         sship.invulnerable = True
         self.level_manager = LevelManager(asset_manager)
-        sship.invulnerable_time_manager = TimeManager(INVULNERABLE_TIME) # add it back cause instantiating the level_manager wipes all the instances from TimeManager
+        sship.invulnerable_time_manager = TimeManager(INVULNERABLE_TIME) # restart it so invulnerability lasts from the start of the game
 
     def pause_game(self):
         """
@@ -376,7 +407,8 @@ class GameState:
 
     def reset_game(self):
         self.end_game()
-        TimeManager.paused = False
+        TimeManager.set_paused(False) # through the clock, so a reset while paused doesn't leave the pause running
+        animation_manager.clear()
         DisplaySpaceshipLives.wipe_lives()
         self.lives = 0
         self.state = "title_menu"
@@ -4,6 +4,7 @@ class HighScoresManager:
     def __init__(self, file_path=HIGH_SCORES_FILE):
         self.file_path = file_path
         self.high_scores = self.get_high_scores_from_file()
+        self.version = 0 # bumped on every saved high score, so anything showing them knows to redraw
         
 
     def is_high_score(self, score: int, score_type: str) -> bool:
@@ -38,6 +39,7 @@ class HighScoresManager:
     
     def save_new_high_score(self, name: str, score: int, score_type: str):
         self.high_scores[score_type][name] = score
+        self.version += 1
         print('saved high scores', name)
         self._save_high_scores_to_file()
     
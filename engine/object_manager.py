@@ -1,17 +1,24 @@
-from entities import Asteroid, Spaceship, UserSpaceship, UserBullet, EnemyBullet, Bullet, EnemySpaceship
-from utils import get_list_item_by_type, BULLET_SIZE, ENEMY_BULLET_SPEED, WHITE, get_direction_to, direction_overlap
+from entities import Asteroid, Spaceship, UserSpaceship, UserBullet, EnemyBullet, Bullet, EnemySpaceship, SpaceEntity, ArrayBacked
+from utils import BULLET_SIZE, ENEMY_BULLET_SPEED, WHITE, get_direction_to, direction_overlap, SpatialGrid, MIN_GRID_CELL_SIZE, EntityStore, Pooled, viewport, dot_batch
 from random import choice
+import numpy as np
+from .entity_list import EntityList
 
 
 class ObjectManager:
     def __init__(self):
         self.objects = {
-            "asteroids": [],
-            "user_bullets": [],
-            "enemy_bullets": [],
-            "user_spaceship": [],
-            "enemy_spaceships": []
+            "asteroids": EntityList(),
+            "user_bullets": EntityList(),
+            "enemy_bullets": EntityList(),
+            "user_spaceship": EntityList(),
+            "enemy_spaceships": EntityList()
         }
+        self.user_spaceship = None
+        # asteroids and bullets are moved and despawned in bulk by the entity store
+        self.entity_store = EntityStore()
+        self.array_backed_types = ("asteroids", "user_bullets", "enemy_bullets")
+        self.bullet_types = ("user_bullets", "enemy_bullets") # drawn as dots from the entity store arrays
         self.type_mapping = {
             Asteroid: "asteroids",
             UserBullet: "user_bullets",
@@ -20,71 +27,229 @@ class ObjectManager:
             UserSpaceship: "user_spaceship",
             EnemySpaceship: "enemy_spaceships"
         }
+        # (type1, type2, method): method is passed to check_collision, 'circle' is cheapest, 'polygon' is exact
         self.collision_pairs = [
-            ("user_spaceship", "asteroids"),
-            ('user_spaceship', 'enemy_spaceships'),
-            ('user_spaceship', 'enemy_bullets'),
-            ('enemy_spaceships', 'asteroids'), 
-            ('enemy_spaceships', 'user_bullets'),
-            ('enemy_spaceships', 'enemy_bullets'),
-            ("asteroids", "user_bullets"),
-            ('asteroids', 'enemy_bullets')
+            ("user_spaceship", "asteroids", 'polygon'),
+            ('user_spaceship', 'enemy_spaceships', 'polygon'),
+            ('user_spaceship', 'enemy_bullets', 'polygon'),
+            ('enemy_spaceships', 'asteroids', 'polygon'), 
+            ('enemy_spaceships', 'user_bullets', 'polygon'),
+            ('enemy_spaceships', 'enemy_bullets', 'polygon'),
+            ("asteroids", "user_bullets", 'polygon'),
+            ('asteroids', 'enemy_bullets', 'polygon')
         ]
+        self.spatial_grid = SpatialGrid(MIN_GRID_CELL_SIZE)
+        self.spatial_grid_stale = False # set when objects have moved since the grid was built
+        self.collision_stats = {
+            'pairs_tested': 0, # pairs that reached check_collision last frame
+            'pairs_possible': 0 # pairs the brute-force loop would have tested
+        }
+        self.render_stats = {
+            'drawn': 0, # objects rendered last frame
+            'culled': 0 # objects skipped last frame because they were off screen
+        }
     
     def get_user_spaceship(self):
-        return get_list_item_by_type(self.objects["user_spaceship"], UserSpaceship) # TODO: have friendly and enemy spaceships stored in sub-dictionary, 
+        return self.user_spaceship
     
     def get_object_type_key(self, obj) -> str:
         """Get the object type key for a given object."""
         return self.type_mapping.get(type(obj), None)
 
-    def get_object_list(self, obj) -> list:
+    def get_object_list(self, obj) -> EntityList:
         """Get the list corresponding to an object's type."""
         obj_type = self.get_object_type_key(obj)
         if obj_type:
             return self.objects[obj_type]
         return None
     
-    def get_object_list2(self, object_list: str) -> list:
+    def get_object_list2(self, object_list: str) -> EntityList:
         return self.objects[object_list]
 
     def remove_object(self, obj):
-        """Remove an object from its list."""
+        """
+        Remove an object from its list in O(1).
+        The object is only flagged dead here; compact_obj_lists drops it at the end of the tick.
+        """
         obj_list = self.get_object_list(obj)
-        if obj_list and obj in obj_list:
-            obj_list.remove(obj)
+        if obj_list is not None:
+            obj_list.discard(obj)
+        if obj is self.user_spaceship:
+            self.user_spaceship = None
+
+    def compact_obj_lists(self):
+        """
+        Drop the objects removed during this tick from their lists.
+        Pooled objects go back to their pool, so this must run after the tick's collision events are handled.
+        """
+        for obj_list in self.objects.values():
+            self._dispose(obj_list.compact())
 
     def wipe_obj_lists(self):
-        for obj_type in self.objects.keys():
-            self.objects[obj_type] = []
+        for obj_list in self.objects.values():
+            self._dispose(obj_list.clear())
+        self.user_spaceship = None
+        self.spatial_grid.clear()
+
+    def _dispose(self, removed_objs):
+        for obj in removed_objs:
+            if isinstance(obj, ArrayBacked):
+                self.entity_store.detach(obj)
+            if isinstance(obj, Pooled):
+                obj.release()
 
     def add_object(self, obj):
-        self.get_object_list(obj).append(obj)
+        self.add_objects((obj,))
+
+    def add_objects(self, objs):
+        """Add several objects, attaching the array-backed ones to the entity store in one bulk write."""
+        for obj in objs:
+            self.get_object_list(obj).append(obj)
+            if isinstance(obj, UserSpaceship):
+                self.user_spaceship = obj
+        self.entity_store.attach_many([obj for obj in objs if isinstance(obj, ArrayBacked)])
+        for obj in objs:
+            # keep objects spawned mid-pass (eg split asteroids) visible to the broad phase
+            self.spatial_grid.insert(obj, self.get_object_type_key(obj), obj.bounds)
 
     def update_objects(self):
         """Update all space objects."""
-        for obj_list in self.objects.values():
-            for obj in obj_list[:]:
+        despawned = self.entity_store.step(SpaceEntity.x_scrnsize(), SpaceEntity.y_scrnsize())
+        for obj in despawned:
+            self.remove_object(obj)
+        for obj_type, obj_list in self.objects.items():
+            if obj_type in self.array_backed_types:
+                continue
+            for obj in obj_list:
                 obj.move()
                 if obj.should_despawn():
-                    self.remove_object(obj)
+                    obj_list.discard(obj)
+        self.spatial_grid_stale = True
 
     def render_objects(self, screen):
-        """Render all space objects."""
-        for obj_list in self.objects.values():
+        """
+        Render all space objects whose bounding circle is on screen.
+        Bullets are queued in dot_batch and flushed before the next object type, so they keep their place
+        between the asteroids and the spaceships.
+        """
+        drawn = culled = 0
+        circle_visible = viewport.circle_visible
+        queued = False
+        for obj_type, obj_list in self.objects.items():
+            if obj_type in self.bullet_types:
+                bullets_drawn, bullets_culled = self.queue_bullets(obj_list)
+                drawn += bullets_drawn
+                culled += bullets_culled
+                queued = queued or bullets_drawn > 0
+                continue
+            if queued:
+                dot_batch.flush(screen)
+                queued = False
             for obj in obj_list:
-                obj.render(screen)
+                if circle_visible(obj.x, obj.y, obj.bounding_radius):
+                    obj.render(screen)
+                    drawn += 1
+                else:
+                    culled += 1
+        if queued:
+            dot_batch.flush(screen)
+        self.render_stats = {
+            'drawn': drawn,
+            'culled': culled
+        }
+
+    def queue_bullets(self, bullets) -> tuple:
+        """
+        Queue the on-screen bullets in dot_batch, reading their positions from the entity store arrays
+        with one add_many per (size, color) group, as Bullet.render would draw them one by one.
+
+        Returns:
+            tuple: (drawn, culled) bullet counts.
+        """
+        groups = {} # (size, color) -> entity store rows
+        for bullet in bullets:
+            key = (bullet.size, bullet.color)
+            rows = groups.get(key)
+            if rows is None:
+                rows = groups[key] = []
+            rows.append(bullet._slot)
+        width, height = viewport.size
+        drawn = culled = 0
+        for (size, color), rows in groups.items():
+            rows = np.array(rows, dtype=np.intp)
+            x = self.entity_store.x[rows]
+            y = self.entity_store.y[rows]
+            visible = (x > -size) & (x < width + size) & (y > -size) & (y < height + size)
+            dot_batch.add_many(x[visible], y[visible], size, color)
+            visible_count = int(np.count_nonzero(visible))
+            drawn += visible_count
+            culled += len(rows) - visible_count
+        return drawn, culled
+
+    def rebuild_spatial_grid(self):
+        """
+        Re-register every object in the broad-phase grid at its current position.
+        The cell size follows the largest bounding radius on screen so no object spans more than a few cells.
+        """
+        max_radius = max(
+            (obj.bounding_radius for obj_list in self.objects.values() for obj in obj_list),
+            default=0
+        )
+        self.spatial_grid.clear(cell_size=max(MIN_GRID_CELL_SIZE, max_radius))
+        for obj_type, obj_list in self.objects.items():
+            for obj in obj_list:
+                self.spatial_grid.insert(obj, obj_type, obj.bounds)
+        self.spatial_grid_stale = False
+
+    def query_nearest(self, x, y, kinds, max_radius=None):
+        """
+        Get the object closest to (x, y) among the given object types.
+
+        Args:
+            x, y (float): The query point.
+            kinds (tuple): Object type keys to search, eg ('asteroids', 'enemy_spaceships').
+            max_radius (float, optional): Ignore objects further away than this.
+
+        Returns:
+            SpaceEntity or None: The nearest object, or None if nothing is in range.
+        """
+        if self.spatial_grid_stale:
+            self.rebuild_spatial_grid()
+        return self.spatial_grid.nearest(x, y, kinds, max_radius)
+
+    def query_radius(self, x, y, radius, kinds) -> list:
+        """Get every object of the given types whose centre lies within 'radius' of (x, y)."""
+        if self.spatial_grid_stale:
+            self.rebuild_spatial_grid()
+        return self.spatial_grid.within(x, y, radius, kinds)
 
     def get_collision_events(self):
+        """
+        Check collisions based on predefined type pairs.
+        Only objects sharing a spatial grid cell are tested against each other.
+        """
         collision_events = []
-        """Check collisions based on predefined type pairs."""
-        for type1, type2 in self.collision_pairs:
-            for obj1 in self.objects[type1][:]:
-                for obj2 in self.objects[type2][:]:
-                    if obj1.check_collision(obj2):
+        self.rebuild_spatial_grid()
+        grid = self.spatial_grid
+        pairs_tested = 0
+        pairs_possible = 0
+        for type1, type2, method in self.collision_pairs:
+            pairs_possible += len(self.objects[type1]) * len(self.objects[type2])
+            for obj1 in self.objects[type1]:
+                for obj2 in grid.query(obj1.bounds, type2):
+                    if not obj1.alive:
+                        break # obj1 was destroyed by an earlier collision
+                    if not obj2.alive:
+                        continue
+                    pairs_tested += 1
+                    if obj1.check_collision(obj2, method):
                         event = self.handle_collision(obj1, obj2)
                         if event:
                             collision_events.append(event)
+        self.collision_stats = {
+            'pairs_tested': pairs_tested,
+            'pairs_possible': pairs_possible
+        }
         return collision_events
 
     def handle_collision(self, obj1, obj2):
@@ -146,8 +311,7 @@ class ObjectManager:
         # self.remove_object(ast)
         ast1, ast2 = ast.split()
         if ast1 and ast2:
-            self.add_object(ast1)
-            self.add_object(ast2)
+            self.add_objects((ast1, ast2))
            
 
     def fire_enemy_sship_bullets(self, level):
@@ -167,13 +331,4 @@ class ObjectManager:
             
     
     def get_nearest_target(self, x, y):
-        asts = self.get_object_list2('asteroids')
-        min_x = float('inf')
-        min_y = float('inf')
-        nearest_target = None
-        for ast in asts:
-            if abs(x - ast.x) + abs(y-ast.y) < min_x + min_y :
-                min_x = ast.x
-                min_y = ast.y
-                nearest_target = ast
-        return nearest_target
\ No newline at end of file
+        return self.query_nearest(x, y, ('asteroids',))
@@ -3,6 +3,7 @@
 
 # Import specific modules or classes from the package
 from .space_entity import SpaceEntity
+from .array_backed import ArrayBacked
 from .spaceship import Spaceship, UserSpaceship, EnemySpaceship
 from .asteroid import Asteroid
 from .bullet import Bullet, UserBullet, EnemyBullet
@@ -0,0 +1,40 @@
+def _stored(field):
+    """Property reading 'field' from the entity's EntityStore row, or from a plain attribute while detached."""
+    private = '_' + field
+
+    def getter(self):
+        store = self._store
+        if store is None:
+            return getattr(self, private)
+        return getattr(store, field).item(self._slot) # plain float, numpy scalars are slow in per-object code
+
+    def setter(self, value):
+        store = self._store
+        if store is None:
+            setattr(self, private, value)
+        else:
+            getattr(store, field)[self._slot] = value
+
+    return property(getter, setter)
+
+
+class ArrayBacked:
+    """
+    Mixin for entities whose kinematic state can live in an EntityStore row.
+
+    While detached the values are ordinary attributes. Once the ObjectManager attaches the entity,
+    reads and writes go straight to the store's arrays, so the entity (a thin handle) keeps working
+    with the collision and render code while the store moves everything in bulk.
+    """
+    _store = None
+    _slot = None
+    _lifetime = None # ticks left before despawning, None for no limit
+    despawn_out_of_bounds = False
+
+    x = _stored('x')
+    y = _stored('y')
+    prev_x = _stored('prev_x')
+    prev_y = _stored('prev_y')
+    vx = _stored('vx')
+    vy = _stored('vy')
+    lifetime = _stored('lifetime')
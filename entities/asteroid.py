@@ -1,40 +1,59 @@
 import pygame
-from math import cos, sin, pi, sqrt
+from math import sqrt
 from random import randrange, uniform, choice, randint
 from .space_entity import SpaceEntity
-from utils import RandomPolygon
+from .array_backed import ArrayBacked
+from utils import RandomPolygon, Pooled, ASTEROID_POOL_SIZE, MAX_ASTEROID_SIZE
 
 
-class Asteroid(SpaceEntity):
+class Asteroid(Pooled, ArrayBacked, SpaceEntity):
+    pool_size = ASTEROID_POOL_SIZE
+    despawn_out_of_bounds = True
+
     def __init__(self, x, y, size, direction, color, speed=None, width=3):
         speed = speed or (100 / size + 1 )
         super().__init__(x, y, size, speed, direction, color)
         self.width = width
         self.sides = 8
-        self.polygon = RandomPolygon(x, y, size, self.sides, color, 3, self._radii)
+        if self.polygon is None:
+            self.polygon = RandomPolygon(x, y, size, self.sides, color, 3, self._random_radii())
+        else:
+            # recycled from the pool: reshape the old polygon and its radii list in place
+            self.polygon.reshape(x, y, size, color, self._random_radii(self.polygon.radii))
         self.min_size = 10
         self.points = 10 if size > self.min_size*2 else 100
         
+    def release(self):
+        """Drop the sprite of this asteroid's unique shape before handing it back to the pool."""
+        self.polygon.discard_sprite()
+        super().release()
+
     def should_despawn(self):
         return self.is_out_of_bounds
     
-    @property
-    def _radii(self) -> list:
-        """Generate random radii for each vertex."""
+    def _random_radii(self, radii=None) -> list:
+        """Generate random radii for each vertex, overwriting 'radii' if given."""
         min_radius = self.size * 0.5
         max_radius = self.size * 1.5
-        return [uniform(min_radius, max_radius) for _ in range(self.sides)]
+        if radii is None:
+            return [uniform(min_radius, max_radius) for _ in range(self.sides)]
+        for i in range(self.sides):
+            radii[i] = uniform(min_radius, max_radius)
+        return radii
 
     def move(self):
         """Move the asteroid."""
-        dx = self.speed * cos(self.direction * pi / 180)
-        dy = self.speed * sin(self.direction * pi / 180)
+        dx = self.vx
+        dy = self.vy
         self.x += dx
         self.y += dy
         self.polygon.move(dx, dy)
 
     def render(self, screen):
         """Render the asteroid using its polygon."""
+        # the polygon isn't moved when the asteroid is stepped in bulk by an EntityStore
+        self.polygon.center_x = self.x
+        self.polygon.center_y = self.y
         self.polygon.render(screen)
 
     @staticmethod
@@ -49,7 +68,7 @@ class Asteroid(SpaceEntity):
         Returns:
             tuple: (x, y, direction, size), where (x, y) is the spawn position, direction is the angle in degrees, and size is the "radius" in pixels.
         """
-        size = randint(30, 150) # TODO: change to be fraction of screen
+        size = randint(30, MAX_ASTEROID_SIZE) # TODO: change to be fraction of screen
         edge = choice(['top', 'right', 'bottom', 'left'])
         if edge == 'top':  # Spawns at the top edge, moves downward
             x = randint(0, screen_width)
@@ -1,22 +1,41 @@
-from entities import SpaceEntity
+from entities import SpaceEntity, ArrayBacked
+from utils import Pooled, BULLET_POOL_SIZE, unit_vector, dirty_rects
 from pygame import draw
-from math import cos, sin, pi
 
 
-class Bullet(SpaceEntity):
+class Bullet(Pooled, ArrayBacked, SpaceEntity):
+    pool_size = BULLET_POOL_SIZE
+    swept = True # bullets move further than a small asteroid's width per frame, so test the whole step
+
     def __init__(self, x, y, size, speed, direction, color, lifetime=40):
         super().__init__(x, y, size, speed, direction, color)
         self.lifetime = lifetime
+        self.prev_x = x
+        self.prev_y = y
     
     def render(self, screen):
-        draw.circle(screen, self.color, [self.x, self.y], self.size)
+        # the ObjectManager draws its bullets in bulk through dot_batch instead; this draws one on its own
+        dirty_rects.add(draw.circle(screen, self.color, [self.x, self.y], self.size))
 
     def move(self):
-        """Move the bullet."""
-        dx = self.speed * cos(self.direction * pi / 180)
-        dy = self.speed * sin(self.direction * pi / 180)
+        """Move the bullet, remembering where it started for swept collision."""
+        dx = self.vx
+        dy = self.vy
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x += dx
         self.y += dy
+
+    @property
+    def bounds(self):
+        """Bounding box of the whole segment travelled during the last move."""
+        size = self.size
+        return (
+            min(self.x, self.prev_x) - size,
+            min(self.y, self.prev_y) - size,
+            max(self.x, self.prev_x) + size,
+            max(self.y, self.prev_y) + size
+        )
         
     def should_despawn(self):
         if self.lifetime <= 0:
@@ -29,8 +48,9 @@ class Bullet(SpaceEntity):
         """gets the attributes needed of a bullet instance shot from a specific spaceship"""
         # orientation = sship.orientation-90
         corrected_fire_direction = fire_direction - 90
-        dx = size * cos(corrected_fire_direction * pi / 180)
-        dy = size * sin(corrected_fire_direction * pi / 180)
+        unit_x, unit_y = unit_vector(corrected_fire_direction)
+        dx = size * unit_x
+        dy = size * unit_y
         new_x = x + dx
         new_y = y + dy
         return (
@@ -1,17 +1,45 @@
 from abc import ABC, abstractmethod
-import math
-from utils import X_SCRNSIZE, Y_SCRNSIZE
-from pygame import display, error
+from utils import polygon_capsule_overlap, convex_polygons_overlap, segment_distance_squared, unit_vector, viewport
 
 
 class SpaceEntity(ABC):
+    polygon = None # entities drawn as a Polygon set this, the rest collide as circles of radius 'size'
+    swept = False # swept entities collide along the segment from (prev_x, prev_y) to (x, y) covered by their last move
+    heading_offset = 0 # added to 'direction' to get the angle of motion in screen coordinates
+
     def __init__(self, x, y, size, speed, direction, color):
         self.x = x
         self.y = y
         self.size = size
-        self.speed = speed
-        self.direction = direction
+        self._speed = speed
+        self._direction = direction
+        self._update_velocity()
         self.color = color
+        self.alive = True # cleared when the ObjectManager removes the entity
+
+    @property
+    def speed(self):
+        return self._speed
+
+    @speed.setter
+    def speed(self, value):
+        self._speed = value
+        self._update_velocity()
+
+    @property
+    def direction(self):
+        return self._direction
+
+    @direction.setter
+    def direction(self, value):
+        self._direction = value
+        self._update_velocity()
+
+    def _update_velocity(self):
+        """Cache the per-tick displacement (vx, vy) so moving doesn't need any trig."""
+        unit_x, unit_y = unit_vector(self._direction + self.heading_offset)
+        self.vx = self._speed * unit_x
+        self.vy = self._speed * unit_y
 
     @abstractmethod
     def move(self):
@@ -31,30 +59,75 @@ class SpaceEntity(ABC):
         """
         pass
 
-    def check_collision(self, other):
-        """Check if this object collides with another space object."""
-        distance = math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
-        return distance < self.size + other.size
+    def check_collision(self, other, method='circle'):
+        """
+        Check if this object collides with another space object.
+
+        Args:
+            other (SpaceEntity): The object to test against.
+            method (str): 'circle' compares the centres against size + other.size,
+                'polygon' runs check_polygon_collision.
+        """
+        if method == 'polygon':
+            return self.check_polygon_collision(other)
+        x0, y0, x1, y1 = self.relative_path(other)
+        reach = self.size + other.size
+        return segment_distance_squared(0, 0, x0, y0, x1, y1) < reach * reach
+
+    def check_polygon_collision(self, other):
+        """
+        Two-stage collision test: reject on the real bounding circles,
+        then test polygon-vs-circle exactly or polygon-vs-polygon with SAT on the cached convex hulls.
+        Swept circles are tested as capsules covering their last move.
+        """
+        x0, y0, x1, y1 = self.relative_path(other)
+        reach = self.bounding_radius + other.bounding_radius
+        if segment_distance_squared(0, 0, x0, y0, x1, y1) >= reach * reach:
+            return False
+        if self.polygon is None and other.polygon is None:
+            return True
+        if other.polygon is None:
+            return polygon_capsule_overlap(self.polygon.collision_outline, x0, y0, x1, y1, other.size)
+        if self.polygon is None:
+            return polygon_capsule_overlap(other.polygon.collision_outline, -x0, -y0, -x1, -y1, self.size)
+        return convex_polygons_overlap(self.polygon.local_hull, other.polygon.local_hull, x1, y1)
+
+    def relative_path(self, other) -> tuple:
+        """
+        Movement of other's centre relative to this object's centre over the last move, as (x0, y0, x1, y1).
+        Both points are the same for entities that aren't swept.
+        """
+        x0 = (other.prev_x if other.swept else other.x) - (self.prev_x if self.swept else self.x)
+        y0 = (other.prev_y if other.swept else other.y) - (self.prev_y if self.swept else self.y)
+        return x0, y0, other.x - self.x, other.y - self.y
+
+    @property
+    def bounding_radius(self):
+        """Radius of a circle centred on (x, y) that encloses the whole entity."""
+        if self.polygon is not None:
+            return self.polygon.max_radius
+        return self.size
+
+    @property
+    def bounds(self) -> tuple:
+        """Axis-aligned bounding box (min_x, min_y, max_x, max_y) used by the broad phase."""
+        radius = self.bounding_radius
+        return (self.x - radius, self.y - radius, self.x + radius, self.y + radius)
     
     @property
     def is_out_of_bounds(self):
         """Check if the object is outside the screen boundaries."""
+        width, height = viewport.size
         return (
-            self.x < -self.size or self.x > SpaceEntity.x_scrnsize() + self.size or
-            self.y < -self.size or self.y > SpaceEntity.y_scrnsize() + self.size
+            self.x < -self.size or self.x > width + self.size or
+            self.y < -self.size or self.y > height + self.size
         )
     
     @classmethod
     def x_scrnsize(cls):
         # cant make a property because class properties are depreciated
-        try:
-            return display.get_window_size()[0]
-        except error as e:
-            return X_SCRNSIZE
+        return viewport.width
         
     @classmethod
-    def y_scrnsize(self):
-        try:
-            return display.get_window_size()[1]
-        except error as e:
-            return X_SCRNSIZE
\ No newline at end of file
+    def y_scrnsize(cls):
+        return viewport.height
\ No newline at end of file
@@ -1,11 +1,13 @@
 import pygame as pg
-from math import cos, sin, pi, sqrt, asin, atan
+from math import cos, sin, sqrt, asin, atan
 from entities import SpaceEntity
 from random import randrange, choice
-from utils import WHITE, BLACK, ACCELERATION, DEG2RAD, RAD2DEG, ROTATE, X_SCRNSIZE, Y_SCRNSIZE, DECELERATION, is_key_pressed, UserSpaceshipPolygon, flicker, RocketPolygon, FLICKER_ROCKET_DURATION, FLICKER_INVULNERABLE_DURATION, INVULNERABLE_TIME, TimeManager, EnemySpaceshipPolygon, Polygon, flipcoin, BIG_ENEMY_SSHIP_SIZE, BIG_ENEMY_SSHIP_SPEED, SMALL_ENEMY_SSHIP_SIZE, SMALL_ENEMY_SSHIP_SPEED, CHANGE_DIRECTION_ENEMY_SSHIP_CHANCE
+from utils import WHITE, BLACK, ACCELERATION, DEG2RAD, RAD2DEG, ROTATE, DECELERATION, is_key_pressed, UserSpaceshipPolygon, flicker, RocketPolygon, FLICKER_ROCKET_DURATION, FLICKER_INVULNERABLE_DURATION, INVULNERABLE_TIME, TimeManager, EnemySpaceshipPolygon, Polygon, flipcoin, BIG_ENEMY_SSHIP_SIZE, BIG_ENEMY_SSHIP_SPEED, SMALL_ENEMY_SSHIP_SIZE, SMALL_ENEMY_SSHIP_SPEED, CHANGE_DIRECTION_ENEMY_SSHIP_CHANCE, viewport
 
 
 class Spaceship(SpaceEntity):
+    heading_offset = -90 # direction 0 points up the screen
+
     def __init__(self, x, y, size, speed, direction, color, width, polygon, screen, sound_manager):
         super().__init__(x, y, size, speed, direction, color)
         self.width = width
@@ -15,17 +17,11 @@ class Spaceship(SpaceEntity):
 
     @property
     def x_scrnsize(self):
-        try:
-            return pg.display.get_window_size()[0]
-        except pg.error as e:
-            return X_SCRNSIZE
+        return viewport.width
         
     @property
     def y_scrnsize(self):
-        try:
-            return pg.display.get_window_size()[1]
-        except pg.error as e:
-            return Y_SCRNSIZE
+        return viewport.height
     
     def synchronize_polygons(self, polygons: list[Polygon]):
         # TODO: potentially move this to utils and use for Asteroid too
@@ -83,8 +79,8 @@ class UserSpaceship(Spaceship):
 
 
     def move(self): 
-        self.x = self.x + (self.speed * cos(pi / 180 * (self.direction - 90) ))
-        self.y = self.y + (self.speed * sin(pi / 180 * (self.direction - 90) ))
+        self.x = self.x + self.vx
+        self.y = self.y + self.vy
         if not self.is_destroying:
             if is_key_pressed(pg.K_UP):
                 # self.render_rocket(self.screen) # instead render rocket in self.render
@@ -138,7 +134,6 @@ class UserSpaceship(Spaceship):
             self.orientation = 0
             self.polygon.orientation = 0
             self.invulnerable = True
-            TimeManager.instances.remove(self.invulnerable_time_manager) # remove to avoid overhead by adding too many TimeManager instances
             self.invulnerable_time_manager = TimeManager(INVULNERABLE_TIME)     
                 
     def check_invulnerable_status(self):
@@ -163,8 +158,8 @@ class EnemySpaceship(Spaceship):
                 self.direction += 45
             else:
                 self.direction -=45
-        self.x = self.x + (self.speed * cos(pi / 180 * (self.direction - 90) ))
-        self.y = self.y + (self.speed * sin(pi / 180 * (self.direction - 90) ))    
+        self.x = self.x + self.vx
+        self.y = self.y + self.vy
         self.synchronize_polygons([self.polygon])
 
     @staticmethod
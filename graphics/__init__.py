@@ -3,6 +3,8 @@ from .animation_manager import AnimationManager
 from .animations import ParticleExplosionAnimation, UserSpaceshipDeathAnimation
 from .display import Display, DisplayElement, DisplaySpaceshipLives
 from .render_manager import RenderManager
+from .layout import Layout, layout
+from .particles import ParticleBuffer, particle_buffer
 
 __all__ = [
     "AnimationManager",
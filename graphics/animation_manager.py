@@ -1,19 +1,89 @@
+from time import perf_counter
+from .particles import particle_buffer
+
+
 class AnimationManager:
+    """
+    The active animations, updated and drawn once per frame.
+
+    Finished animations are dropped in a single compacting pass that keeps the order of the rest, and
+    handed back to their pool to be recycled by the next animation of their type. Spawns, retirements
+    and update time are counted per animation type (see stats()).
+    """
     def __init__(self):
         self.animations = []  # A list of active animations
+        self.render_stats = {'drawn': 0, 'culled': 0} # last frame's drawn / off-screen (skipped) animation parts
+        self.type_stats = {} # animation class -> counters since the last reset_stats
+
+    def _type_stats(self, animation_type) -> dict:
+        stats = self.type_stats.get(animation_type)
+        if stats is None:
+            stats = self.type_stats[animation_type] = {'spawned': 0, 'retired': 0, 'updates': 0, 'update_time': 0.0}
+        return stats
 
     def add_animation(self, animation):
         """Add a new animation."""
         self.animations.append(animation)
+        self._type_stats(type(animation))['spawned'] += 1
+
+    def clear(self):
+        """Drop every animation and particle, eg when a game starts or resets."""
+        for animation in self.animations:
+            animation.release()
+        self.animations = []
+        particle_buffer.clear()
 
     def update_animations(self):
-        """Update all active animations."""
-        for animation in self.animations[:]:  # Iterate over a copy to allow safe removal
+        """Update all active animations and step every particle, then drop and recycle the finished ones."""
+        particle_buffer.step()
+        animations = self.animations
+        count = len(animations) # animations added while updating wait for the next frame
+        kept = 0
+        for i in range(count):
+            animation = animations[i]
+            stats = self._type_stats(type(animation))
+            start = perf_counter()
             animation.update()
+            stats['update_time'] += perf_counter() - start
+            stats['updates'] += 1
             if animation.finished:
-                self.animations.remove(animation)
+                stats['retired'] += 1
+                animation.release()
+            else:
+                animations[kept] = animation
+                kept += 1
+        del animations[kept:count]
 
     def render_animations(self, screen):
-        """Render all active animations."""
+        """Render all active animations, then every particle."""
+        drawn = culled = 0
         for animation in self.animations:
             animation.render(screen)
+            drawn += animation.drawn
+            culled += animation.culled
+        particle_buffer.render(screen)
+        drawn += particle_buffer.render_stats['drawn']
+        culled += particle_buffer.render_stats['culled']
+        self.render_stats = {
+            'drawn': drawn,
+            'culled': culled
+        }
+
+    def stats(self) -> dict:
+        """Counters of each animation type, by class name. update_time is the total spent in update, in milliseconds."""
+        active = {}
+        for animation in self.animations:
+            active[type(animation)] = active.get(type(animation), 0) + 1
+        return {
+            animation_type.__name__: {
+                'active': active.get(animation_type, 0),
+                'spawned': stats['spawned'],
+                'retired': stats['retired'],
+                'updates': stats['updates'],
+                'update_time': stats['update_time'] * 1000
+            }
+            for animation_type, stats in self.type_stats.items()
+        }
+
+    def reset_stats(self):
+        self.type_stats = {}
@@ -1,11 +1,15 @@
 import pygame as pg
 from abc import ABC, abstractmethod
-from math import cos, sin, pi
-from utils import Line
-from random import random, uniform
-from utils import TimeManager, sign
+from utils import Line, unit_vector
+from random import uniform
+from utils import TimeManager, sign, dirty_rects, Pooled, ANIMATION_POOL_SIZE
+
+class Animation(Pooled, ABC):
+    pool_size = ANIMATION_POOL_SIZE # finished animations are released by AnimationManager
+    # parts drawn / skipped as off screen by the last render; animations that cull their own parts update these
+    drawn = 1
+    culled = 0
 
-class Animation(ABC):
     def __init__(self, x, y, size, duration):
         self.x = x
         self.y = y
@@ -38,111 +42,75 @@ class ExplosionAnimation(Animation):
             radius = int(self.size * (self.elapsed / self.duration))
             alpha = max(0, 255 - int((self.elapsed / self.duration) * 255))
             color = (255, alpha, 0)  # Fading yellow
-            pg.draw.circle(screen, color, (self.x, self.y), radius)
-
-from random import uniform, randint
-from math import cos, sin, radians
-import pygame as pg
+            dirty_rects.add(pg.draw.circle(screen, color, (self.x, self.y), radius))
 
-import pygame as pg
-from math import cos, sin, radians
-from random import uniform, randint
 from graphics.animations import Animation  # Import the base class
-
-class Particle:
-    """Represents a single particle in an explosion."""
-    def __init__(self, x, y, color, size, speed, direction, lifetime):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = size
-        self.speed = speed
-        self.direction = direction
-        self.lifetime = lifetime
-        self.elapsed = 0  # Tracks particle's age
-    
-    def update(self):
-        """Move the particle and update its state."""
-        self.x += self.speed * cos(radians(self.direction))
-        self.y += self.speed * sin(radians(self.direction))
-        self.elapsed += 1
-        return self.elapsed < self.lifetime  # Particle is active if within lifetime
-    
-    def render(self, screen):
-        """Draw the particle on the screen."""
-        pg.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size)
+from .particles import particle_buffer
 
 
 class ParticleExplosionAnimation(Animation):
-    """Explosion effect with particles, extending the Animation base class."""
+    """
+    Explosion effect with particles, extending the Animation base class.
+    The particles live in the shared particle_buffer, which moves, expires and draws them all at once.
+    """
+    drawn = 0 # counted by the particle buffer instead
+
     def __init__(self, x, y, color, particle_count=30, max_lifetime=50): # change to take from entity so it can move in the same direction as the exploded sship or ast.
         super().__init__(x, y, size=0, duration=max_lifetime)  # Size is irrelevant for this animation
-        self.particles = [
-            Particle(
-                x, y, color, 
-                size=randint(2, 5), 
-                speed=uniform(1, 5), 
-                direction=uniform(0, 360), 
-                lifetime=randint(max_lifetime//2, max_lifetime)
-            )
-            for _ in range(particle_count)
-        ]
+        particle_buffer.emit(
+            x, y, color, particle_count,
+            size_range=(2, 5),
+            speed_range=(1, 5),
+            lifetime_range=(max_lifetime//2, max_lifetime)
+        )
 
     def update(self):
-        """Update all particles."""
-        self.particles = [p for p in self.particles if p.update()]
+        """The buffer steps the particles; the animation just lasts as long as the longest-lived one could."""
         self.elapsed += 1
-        self.finished = len(self.particles) == 0  # Animation finishes when all particles expire
+        self.finished = self.elapsed >= self.duration
         return not self.finished
     
     def render(self, screen):
-        """Render all particles."""
-        for particle in self.particles:
-            particle.render(screen)
+        """Particles are drawn by AnimationManager through the particle buffer."""
+        pass
 
 class UserSpaceshipDeathAnimation(Animation):
+    """
+    The spaceship breaking into three lines that drift apart, spin and fade out.
+    Everything per line is worked out once here; each frame only moves and turns the same Line objects.
+    """
+    directions = (-90, -90, 180) # angles for line dispersion, relative to the spaceship's orientation
+
     def __init__(self, spaceship, duration):
         super().__init__(spaceship.x, spaceship.y, spaceship.size, duration)
         self.spaceship = spaceship
         self.orientation = spaceship.orientation
         self.polygon = spaceship.polygon
-        self.lines = []  # Store all destructed lines
         self.rotation_speed_factors = [
                     (uniform(-1,1)),
                     (uniform(-.9,1)),
                     (uniform(-.8,1)),
                     ] # TODO: have this be more of a factor: more randomness
-
-    def _calculate_lines(self):
-        vertices = self.polygon.vertices
-        directions = [-90, -90, 180]  # Angles for line dispersion
-
-        new_lines = []
-        for idx, angle in enumerate(directions):
+        # faded gray for each frame
+        self.fade_colors = [(shade, shade, shade) for shade in (max(0, 255 - int(elapsed / duration * 255)) for elapsed in range(duration))]
+        self.lines, self.velocities, self.spins = self._calculate_lines()
+
+    def _calculate_lines(self) -> tuple:
+        """The destructed lines, and how far each one moves (dx, dy) and turns (degrees) per frame."""
+        vertices = [tuple(vertex) for vertex in self.polygon.vertices]
+        # the wreck keeps drifting with the spaceship's velocity (its speed and heading don't change while destroying)
+        drift_x, drift_y = self.spaceship.vx, self.spaceship.vy
+        lines, velocities, spins = [], [], []
+        for idx, angle in enumerate(self.directions):
             start = vertices[idx * 2]  # Starting vertex for each line
             end = vertices[(idx * 2 + 1) % len(vertices)]  # Next vertex
-
-            displacement = self.elapsed
-            new_start = (
-                start[0] + displacement * cos(pi / 180 * (self.orientation - 90 + angle)),
-                start[1] + displacement * sin(pi / 180 * (self.orientation - 90 + angle))
-            )
-            new_end = (
-                end[0] + displacement * cos(pi / 180 * (self.orientation - 90 + angle)),
-                end[1] + displacement * sin(pi / 180 * (self.orientation - 90 + angle))
-            )
-
-            # Calculate color fading
-            fade_ratio = self.elapsed / (self.duration)
-            color = (
-                max(0, 255 - int(fade_ratio * 255)),
-                max(0, 255 - int(fade_ratio * 255)),
-                max(0, 255 - int(fade_ratio * 255))
-            )
-
-            new_lines.append(Line(*new_start, *new_end, color))
-
-        return new_lines
+            lines.append(Line(*start, *end, self.fade_colors[0]))
+            unit_x, unit_y = unit_vector(self.orientation - 90 + angle)
+            velocities.append((drift_x + unit_x, drift_y + unit_y))
+            rotation_speed = self.rotation_speed_factors[idx]
+            # TODO: have them rotate different directions
+            spins.append(sign(rotation_speed) * (1 + abs(rotation_speed) + self.spaceship.speed))
+        return lines, velocities, spins
 
     def update(self):
         if TimeManager.paused:
@@ -154,20 +122,13 @@ class UserSpaceshipDeathAnimation(Animation):
             self.spaceship.is_destroying = False
             self.finished = True
             self.spaceship.destroy()
-        self.lines = self._calculate_lines()
+            return
+        color = self.fade_colors[self.elapsed]
+        for line, (dx, dy), spin in zip(self.lines, self.velocities, self.spins):
+            line.move(dx, dy)
+            line.rotate(spin)
+            line.color = color
 
     def render(self, screen):
-        for idx, line in enumerate(self.lines):
-            rotation_speed = self.rotation_speed_factors[idx]
-            if not TimeManager.paused: # TODO: have them rotate different directions
-                line.rotate(
-                    1
-                    * self.elapsed
-                    * sign(rotation_speed)
-                    * ( 1 
-                       + abs(rotation_speed)
-                       + self.spaceship.speed
-                       )
-                    )
+        for line in self.lines:
             line.draw(screen)
-
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 import pygame as pg
-from utils import BLACK, WHITE, X_SCRNSIZE, Y_SCRNSIZE, translate_to_ratio
-import re
-from utils import UserSpaceshipPolygon, SPACESHIP_STARTING_LIVES
+from utils import BLACK, WHITE, Y_SCRNSIZE
+from utils import UserSpaceshipPolygon, SPACESHIP_STARTING_LIVES, SurfaceCache, TEXT_CACHE_BYTES, TEXT_ELEMENT_CACHE_SIZE, dirty_rects
+
+from .layout import layout
+
+# rendered text keyed (text, font name, font size, color, antialias)
+text_cache = SurfaceCache(TEXT_CACHE_BYTES)
 
 
 class DisplayElement(ABC):
@@ -15,70 +20,17 @@ class DisplayElement(ABC):
     
     @staticmethod
     def x_scrnsize() -> int:
-        try:
-            x, _ = pg.display.get_window_size()
-            return int(x)
-        except Exception as e:
-            return X_SCRNSIZE
+        return int(layout.width)
     
     @staticmethod
     def y_scrnsize() -> int:
-        try:
-            _, y = pg.display.get_window_size()
-            return int(y)
-        except Exception as e:
-            return Y_SCRNSIZE
-        
-    @staticmethod
-    def _center_position(rendered_text):
-        return (
-            DisplayElement.x_scrnsize() / 2 - rendered_text.get_width() / 2,
-            DisplayElement.y_scrnsize() / 2 - rendered_text.get_height() / 2
-        )
+        return int(layout.height)
         
-    @staticmethod
-    def _upper_left_position():
-        return (0, 0)
-        
-    @staticmethod
-    def _upper_right_position(rendered_text):
-        return (
-            DisplayElement.x_scrnsize() - rendered_text.get_width(),
-            0
-        )
-     
-    @staticmethod   
-    def _lower_left_position(rendered_text):
-        return (
-            0,
-            DisplayElement.y_scrnsize() - rendered_text.get_height()
-        )
-        
-    @staticmethod
-    def _lower_right_position(rendered_text):
-        return (
-            DisplayElement.x_scrnsize() - rendered_text.get_width(),
-            DisplayElement.y_scrnsize() - rendered_text.get_height()
-        )
-
-    @staticmethod
-    def _default_position(position_type: str, rendered_text):
-        if position_type == "center":
-            return DisplayElement._center_position(rendered_text)
-        elif position_type == "upper_left":
-            return DisplayElement._upper_left_position()
-        elif position_type == "lower_left":
-            return DisplayElement._lower_left_position(rendered_text)
-        elif position_type == "upper_right":
-            return DisplayElement._upper_right_position(rendered_text)
-        elif position_type == "lower_right":
-            return DisplayElement._lower_right_position(rendered_text)
-    
     @staticmethod
     def parse_position(position, offset, rendered_text):
         """
-        Parses a position string and calculates the position.
-        Supports 'center' with optional offsets in the format: "center:(+x,+y)".
+        Calculates the pixel position of 'rendered_text' at a generic placement ('center', 'upper_left',
+        'upper_right', 'lower_left', 'lower_right') moved by 'offset', or at 'offset' if position is None.
         """
         if not isinstance(position, str):
             # if isinstance(position, Tuple):
@@ -86,15 +38,7 @@ class DisplayElement(ABC):
                 return offset
             else:
                 raise ValueError("Position must be a string or None.")
-        if  re.match(r"center|upper_left|upper_right|lower_left|lower_right", position):
-            # Extract offsets
-            delta_x, delta_y = offset
-            # Calculate position with offsets
-            default_position_x, default_position_y = DisplayElement._default_position(position, rendered_text)
-            parsed_position = (default_position_x + delta_x, default_position_y + delta_y)
-        else:
-            raise ValueError(f"Invalid position format: {position}")
-        return parsed_position
+        return layout.position(position, offset, (rendered_text.get_width(), rendered_text.get_height()))
 
 class Display:
     def __init__(self, screen, asset_manager):
@@ -107,6 +51,8 @@ class Display:
         self.elements = []  # Holds all DisplayElement instances
         self.title_elements_added = False  # Track if title elements are added
         self.last_displayed_score = 0
+        self.text_elements = OrderedDict() # craft_element arguments -> DisplayText, least recently used first
+        self.panels = {} # panel name -> (key, surface, topleft) of static screens composited offscreen
 
     def add_element(self, element):
         """Add a new display element."""
@@ -125,20 +71,31 @@ class Display:
             custom_font_path=None,
             color=WHITE
         ):
-        coords = (translate_to_ratio(coords[0]), translate_to_ratio(coords[1]))
-        font_obj = self.get_font(font_name, translate_to_ratio(font_size), custom_font_path=custom_font_path)
+        coords = (layout.scale(coords[0]), layout.scale(coords[1]))
+        font_size = layout.scale(font_size)
+        key = (str(value), font_name, font_size, generic_placement, coords, color)
+        # reuse the element crafted with the same arguments, with its rendered text and position
+        disp_el = self.text_elements.get(key)
+        if disp_el is not None:
+            self.text_elements.move_to_end(key)
+            return disp_el
+        font_obj = self.get_font(font_name, font_size, custom_font_path=custom_font_path)
         disp_el = DisplayText(
             str(value),
             font_obj,
             color, 
             generic_placement,
-            coords
+            coords,
+            font_key=(font_name, font_size)
         )
+        self.text_elements[key] = disp_el
+        if len(self.text_elements) > TEXT_ELEMENT_CACHE_SIZE:
+            self.text_elements.popitem(last=False)
         return disp_el
     
     def render(self):
         """Render the display and all elements."""
-        self.screen.fill(self.color)
+        dirty_rects.clear(self.screen, self.color)
         pg.display.set_caption(self.caption)
         
     def get_font(self, font_name: str, size: int, custom_font_path=None):
@@ -187,9 +144,11 @@ class Display:
             element.render(self.screen)
     
     def render_game_over_menu(self, points, level, points_high_score, level_high_score):
-        game_over_menu_elements = self.create_game_over_menu_elements(points, level, points_high_score, level_high_score)
-        for element in game_over_menu_elements:
-            element.render(self.screen)
+        self.render_panel(
+            'game_over_menu',
+            (points, level, points_high_score, level_high_score),
+            lambda: self.create_game_over_menu_elements(points, level, points_high_score, level_high_score)
+        )
             
     def render_new_high_score(self, points: int, level: int, initials: list):
         new_high_score_elements = self.create_new_high_score_elements(points, level, initials)
@@ -207,11 +166,11 @@ class Display:
         ]
         high_score_text_height = -Y_SCRNSIZE/2+40
         high_score_text_size = 15
-        points_level_text_height = high_score_text_height + translate_to_ratio(high_score_text_size+7)
+        points_level_text_height = high_score_text_height + layout.scale(high_score_text_size+7)
         high_score_size = 30
-        high_score_height = points_level_text_height + translate_to_ratio(high_score_size)
-        initials_text_size = translate_to_ratio(high_score_size/2)
-        initials_text_height = high_score_height + initials_text_size + translate_to_ratio(8)
+        high_score_height = points_level_text_height + layout.scale(high_score_size)
+        initials_text_size = layout.scale(high_score_size/2)
+        initials_text_height = high_score_height + initials_text_size + layout.scale(8)
         stats = [
             self.craft_element("HIGH SCORE", 20, "center", (0, high_score_text_height)),
             self.craft_element("LEVEL", high_score_text_size, "center", (-50, points_level_text_height)),
@@ -226,16 +185,48 @@ class Display:
     def set_title_elements(self, points_high_score_tup: tuple, level_high_score_tup: tuple, points=0, level=1):
         self.title_elements = [
             self.craft_element('ASTEROIDS', (150), 'center', (0, -40)),
-            self.craft_element('Jeremy Zay', (50), 'center', (0, (DisplayElement.y_scrnsize()/2)-translate_to_ratio(120)), font_name='signature', custom_font_path='signature.otf'),
+            self.craft_element('Jeremy Zay', (50), 'center', (0, (layout.height/2)-layout.scale(120)), font_name='signature', custom_font_path='signature.otf'),
             self.craft_element('CLICK TO PLAY', (30), 'center', (0, 65)),
             # self.craft_element('Named best game of all time by Obama', (40), 'lower_left', (50,-50), font_name='minecraft', custom_font_path='minecraft_font.ttf')
         ]
         self.title_elements += self.score_high_score_elements(points, level, points_high_score_tup, level_high_score_tup)
         
     def render_title_screen(self, points_high_score_tup: tuple, level_high_score_tup: tuple):
-        self.set_title_elements(points_high_score_tup, level_high_score_tup)
-        for element in self.title_elements:
-            element.render(self.screen)
+        def create_title_elements():
+            self.set_title_elements(points_high_score_tup, level_high_score_tup)
+            return self.title_elements
+        self.render_panel('title', (points_high_score_tup, level_high_score_tup), create_title_elements)
+
+    @staticmethod
+    def composite_panel(elements) -> tuple:
+        """Blit text elements onto one transparent surface just big enough to hold them. Returns (surface, topleft)."""
+        placements = [element.placement() for element in elements]
+        rects = [pg.Rect(position, rendered_text.get_size()) for rendered_text, position in placements]
+        bounds = rects[0].unionall(rects[1:])
+        panel = pg.Surface(bounds.size, pg.SRCALPHA)
+        for (rendered_text, _), rect in zip(placements, rects):
+            # RGBA_MAX keeps the text's own alpha instead of blending it with the transparent panel
+            panel.blit(rendered_text, rect.move(-bounds.x, -bounds.y), special_flags=pg.BLEND_RGBA_MAX)
+        if pg.display.get_surface() is not None:
+            panel = panel.convert_alpha()
+        # the panel is mostly transparent: RLE skips those runs instead of blending every pixel
+        panel.set_alpha(255, pg.RLEACCEL)
+        return panel, bounds.topleft
+
+    def render_panel(self, name: str, key: tuple, create_elements):
+        """
+        Blit the panel 'name', compositing the elements from create_elements() first if it isn't cached
+        for 'key' and the current window size. invalidate_panels() drops every cached panel.
+        """
+        key = (key, layout.version)
+        cached = self.panels.get(name)
+        if cached is None or cached[0] != key:
+            cached = self.panels[name] = (key, *self.composite_panel(create_elements()))
+        _, panel, topleft = cached
+        dirty_rects.add(self.screen.blit(panel, topleft))
+
+    def invalidate_panels(self):
+        self.panels = {}
         
     def init_hud_elements(self, score: int, lives: int):
         self.hud_elements = [
@@ -278,35 +269,59 @@ class Display:
     def render_new_level(self, level: int, display_new_level: bool, color_counter: int):
         self.new_level_element = []
         if display_new_level:
-            color = (
-                255 - color_counter,
-                255 - color_counter,
-                255 - color_counter
-            )
+            # one white element faded with surface alpha, rather than a new gray text (and cache entry) every frame
             self.new_level_element = [
-                self.craft_element(f'LEVEL {level}', 150, 'center', (0,0), color=color)
+                self.craft_element(f'LEVEL {level}', 150, 'center', (0,0))
             ]
         for element in self.new_level_element:
-            element.render(self.screen)
+            element.render_faded(self.screen, 255 - color_counter)
         
 
 class DisplayText(DisplayElement):
-    def __init__(self, text: str, font, color: tuple, position, offset: tuple):
+    antialias = True
+
+    def __init__(self, text: str, font, color: tuple, position, offset: tuple, font_key=None):
         super().__init__()
         self.text = text
         self.font = font
         self.color = color
         self.position = position
         self.offset = offset
-        
+        self.font_key = font_key if font_key is not None else (font, None) # (font name, size) when known
+        self._blit_position = None
+        self._layout_version = None # layout version _blit_position was computed for
+
+    @property
+    def rendered_text(self):
+        """The text rendered by font.render, shared through text_cache by every element showing the same text."""
+        font_name, font_size = self.font_key
+        return text_cache.get_or_create(
+            (self.text, font_name, font_size, self.color, self.antialias),
+            lambda: self.font.render(self.text, self.antialias, self.color)
+        )
+
+    def placement(self) -> tuple:
+        """The rendered text and where to blit it, recomputed when the layout changes."""
+        rendered_text = self.rendered_text
+        if self._layout_version != layout.version:
+            self._blit_position = DisplayElement.parse_position(self.position, self.offset, rendered_text)
+            self._layout_version = layout.version
+        return rendered_text, self._blit_position
+
     def render(self, screen):
-        rendered_text = self.font.render(self.text, True, self.color)
-        screen.blit(rendered_text, DisplayElement.parse_position(self.position, self.offset, rendered_text))
+        dirty_rects.add(screen.blit(*self.placement()))
+
+    def render_faded(self, screen, alpha: int):
+        """Render with the whole text faded to 'alpha', leaving the shared cached surface as it was."""
+        rendered_text, position = self.placement()
+        rendered_text.set_alpha(alpha)
+        dirty_rects.add(screen.blit(rendered_text, position))
+        rendered_text.set_alpha(None)
 
 
 class DisplayTitleText(DisplayText):
-    def __init__(self, text, font, color, position, offset):
-        super().__init__(text, font, color, position, offset)
+    def __init__(self, text, font, color, position, offset, font_key=None):
+        super().__init__(text, font, color, position, offset, font_key)
 
 
 class DebugValue(DisplayElement):
@@ -321,7 +336,7 @@ class DebugValue(DisplayElement):
         font = pg.font.SysFont("arial", self.font_size)
         text = f"{self.label}: {self.value}"
         rendered_text = font.render(text, True, self.color)
-        screen.blit(rendered_text, self.position)
+        dirty_rects.add(screen.blit(rendered_text, self.position))
         
 class DisplaySpaceshipLives:
     lives = 0
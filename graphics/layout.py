@@ -0,0 +1,75 @@
+from utils import translate_to_ratio, viewport
+
+# where each generic placement puts an element, as fractions of the space left around it
+ANCHORS = {
+    "center": (0.5, 0.5),
+    "upper_left": (0, 0),
+    "upper_right": (1, 0),
+    "lower_left": (0, 1),
+    "lower_right": (1, 1),
+}
+
+
+class Layout:
+    """
+    Resolution-keyed UI layout.
+
+    Scaled sizes and final pixel positions are computed once per window size and element spec, then
+    looked up. The window size comes from the viewport and is only picked up again by refresh(), called
+    when the viewport changes (resize, toggle_fullscreen); 'version' is bumped whenever it changes so
+    downstream caches can key on it.
+    """
+    def __init__(self):
+        self.window_size = None
+        self.version = 0
+        self.scaled = {}    # raw value -> value scaled to the window height
+        self.positions = {} # (placement, offset, element size) -> top-left pixel position
+
+    def refresh(self):
+        """Pick up the viewport size, invalidating every computed layout if it changed."""
+        window_size = viewport.size
+        if window_size != self.window_size:
+            self.window_size = window_size
+            self.scaled = {}
+            self.positions = {}
+            self.version += 1
+
+    @property
+    def size(self) -> tuple:
+        if self.window_size is None:
+            self.refresh()
+        return self.window_size
+
+    @property
+    def width(self) -> int:
+        return self.size[0]
+
+    @property
+    def height(self) -> int:
+        return self.size[1]
+
+    def scale(self, raw_val) -> int:
+        """translate_to_ratio against the cached window height."""
+        scaled = self.scaled.get(raw_val)
+        if scaled is None:
+            scaled = self.scaled[raw_val] = translate_to_ratio(raw_val, screen_size=self.height)
+        return scaled
+
+    def position(self, placement: str, offset: tuple, element_size: tuple) -> tuple:
+        """Top-left pixel position of an element of 'element_size' at a generic placement plus an offset."""
+        key = (placement, offset, element_size)
+        position = self.positions.get(key)
+        if position is None:
+            try:
+                anchor_x, anchor_y = ANCHORS[placement]
+            except KeyError:
+                raise ValueError(f"Invalid position format: {placement}")
+            window_width, window_height = self.size
+            position = self.positions[key] = (
+                anchor_x * (window_width - element_size[0]) + offset[0],
+                anchor_y * (window_height - element_size[1]) + offset[1]
+            )
+        return position
+
+
+layout = Layout()
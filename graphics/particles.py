@@ -0,0 +1,113 @@
+import numpy as np
+from utils import PARTICLE_CAPACITY, dot_batch, viewport
+
+
+class ParticleBuffer:
+    """
+    One structure-of-arrays buffer holding the particles of every explosion.
+
+    Live particles occupy rows [0, count) in the order they were emitted, so the oldest are always
+    at the front: expiring particles are compacted out with a stable boolean mask, and when the
+    buffer is full the oldest rows are dropped to make room for new ones.
+    """
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.int32) # index into palette
+        self.life = np.zeros(capacity, dtype=np.int32)  # frames left
+        self.count = 0
+        self.palette = []     # colors, indexed by the color column
+        self.color_index = {} # color -> index in palette
+        self.evicted = 0      # particles dropped early because the buffer was full
+        self.render_stats = {'drawn': 0, 'culled': 0}
+        self.rng = np.random.default_rng()
+
+    def __len__(self):
+        return self.count
+
+    def _columns(self) -> tuple:
+        return (self.x, self.y, self.vx, self.vy, self.size, self.color, self.life)
+
+    def _color_index(self, color) -> int:
+        index = self.color_index.get(color)
+        if index is None:
+            index = self.color_index[color] = len(self.palette)
+            self.palette.append(color)
+        return index
+
+    def emit(self, x, y, color, count, size_range, speed_range, lifetime_range):
+        """
+        Add 'count' particles bursting from (x, y) in random directions.
+        Sizes and lifetimes are drawn from inclusive integer ranges, speeds from a float range.
+        """
+        count = min(count, self.capacity)
+        if count <= 0:
+            return
+        overflow = self.count + count - self.capacity
+        if overflow > 0:
+            # drop the oldest particles, keeping the rest in emission order
+            for column in self._columns():
+                column[:self.count - overflow] = column[overflow:self.count]
+            self.count -= overflow
+            self.evicted += overflow
+        start = self.count
+        end = start + count
+        rng = self.rng
+        direction = np.radians(rng.uniform(0, 360, count))
+        speed = rng.uniform(*speed_range, count)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = speed * np.cos(direction)
+        self.vy[start:end] = speed * np.sin(direction)
+        self.size[start:end] = rng.integers(size_range[0], size_range[1], count, endpoint=True)
+        self.color[start:end] = self._color_index(color)
+        self.life[start:end] = rng.integers(lifetime_range[0], lifetime_range[1], count, endpoint=True)
+        self.count = end
+
+    def step(self):
+        """Move every particle and drop the ones whose lifetime ran out, in one vectorized pass."""
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        life = self.life[:n]
+        life -= 1
+        alive = life > 0
+        kept = int(np.count_nonzero(alive))
+        if kept == n:
+            return
+        for column in self._columns():
+            column[:kept] = column[:n][alive]
+        self.count = kept
+
+    def clear(self):
+        self.count = 0
+
+    def render(self, screen):
+        """Queue the particles whose bounding circle is on screen in the dot batch (drawn by its flush)."""
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        size = self.size[:n]
+        width, height = viewport.size
+        visible = np.flatnonzero((x > -size) & (x < width + size) & (y > -size) & (y < height + size))
+        x, y, size = x[visible], y[visible], size[visible]
+        color = self.color[:n][visible]
+        # one add_many per (color, size) group rather than a call per particle
+        span = int(size.max(initial=0)) + 1
+        group = color * span + size
+        for key in np.unique(group).tolist():
+            in_group = group == key
+            dot_batch.add_many(x[in_group], y[in_group], key % span, self.palette[key // span])
+        self.render_stats = {
+            'drawn': len(visible),
+            'culled': n - len(visible)
+        }
+
+
+particle_buffer = ParticleBuffer()
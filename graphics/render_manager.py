@@ -1,5 +1,8 @@
+from time import perf_counter
+
+
 class RenderLayer:
-    def __init__(self, render_function, z_index, states=None, bools=None):
+    def __init__(self, render_function, z_index, states=None, bools=None, name=None):
         """
         Represents a rendering layer.
 
@@ -7,11 +10,27 @@ class RenderLayer:
             render_function (callable): A function to render this layer.
             z_index (int): Determines the order of rendering (lower numbers render first).
             states (list, optional): A list of game states where this layer should render. Defaults to None (renders in all states).
+            name (str, optional): Label used in timings. Defaults to the z-index.
         """
         self.render_function = render_function
         self.z_index = z_index
         self.states = states if states is not None else []
         self.bools = bools if bools else []
+        self.name = name if name is not None else f"layer_{z_index}"
+        self.render_time = 0.0 # seconds spent in render_function since the last reset_timings
+        self.render_count = 0
+
+    def is_active(self, game_state) -> bool:
+        return not self.states or game_state in self.states
+
+    def draw(self, screen):
+        """Call the render function, timing it."""
+        if self.bools and not all(self.bools):
+            return
+        start = perf_counter()
+        self.render_function(screen)
+        self.render_time += perf_counter() - start
+        self.render_count += 1
 
     def render(self, screen, game_state):
         """
@@ -21,15 +40,20 @@ class RenderLayer:
             screen: The Pygame screen to render on.
             game_state (str): The current game state.
         """
-        if (not self.states or game_state in self.states) and (not self.bools or all(self.bools)):
-            self.render_function(screen)
+        if self.is_active(game_state):
+            self.draw(screen)
 
 
 class RenderManager:
+    """
+    Persistent layer graph: layers are added once at startup, kept sorted by z-index, and indexed
+    by game state so render() only visits the layers active in the current state.
+    """
     def __init__(self):
         self.layers = []
+        self.state_layers = {} # game state -> its active layers in z order, rebuilt lazily after add_layer
 
-    def add_layer(self, render_function, z_index, states=None):
+    def add_layer(self, render_function, z_index, states=None, name=None):
         """
         Add a render layer.
 
@@ -37,10 +61,27 @@ class RenderManager:
             render_function (callable): The function to render this layer.
             z_index (int): Determines the rendering order.
             states (list, optional): A list of states where this layer renders. Defaults to None (renders in all states).
+            name (str, optional): Label used in timings.
         """
-        layer = RenderLayer(render_function, z_index, states)
-        self.layers.append(layer)
-        self.layers.sort(key=lambda l: l.z_index)  # Keep layers sorted by z-index
+        layer = RenderLayer(render_function, z_index, states, name=name)
+        # insert after any layers with the same z-index, so they keep rendering in the order they were added
+        index = len(self.layers)
+        while index > 0 and self.layers[index - 1].z_index > z_index:
+            index -= 1
+        self.layers.insert(index, layer)
+        self.state_layers = {}
+        return layer
+
+    def clear(self):
+        self.layers = []
+        self.state_layers = {}
+
+    def layers_for(self, game_state) -> list:
+        """The layers rendered in 'game_state', in z order."""
+        layers = self.state_layers.get(game_state)
+        if layers is None:
+            layers = self.state_layers[game_state] = [layer for layer in self.layers if layer.is_active(game_state)]
+        return layers
 
     def render(self, screen, game_state):
         """
@@ -50,5 +91,17 @@ class RenderManager:
             screen: The Pygame screen to render on.
             game_state (str): The current game state.
         """
+        for layer in self.layers_for(game_state):
+            layer.draw(screen)
+
+    def timings(self) -> dict:
+        """Average render time per call of each layer, in milliseconds."""
+        return {
+            layer.name: layer.render_time / layer.render_count * 1000 if layer.render_count else 0
+            for layer in self.layers
+        }
+
+    def reset_timings(self):
         for layer in self.layers:
-            layer.render(screen, game_state)
\ No newline at end of file
+            layer.render_time = 0.0
+            layer.render_count = 0
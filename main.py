@@ -8,8 +8,7 @@ def main():
     game_state = GameState(lives=SPACESHIP_STARTING_LIVES)
     while game_state.state != "exit":
         game_state.handle_events()
-        game_state.update_game()
-        game_state.handle_collisions()
+        game_state.update_game() # also resolves collisions
         game_state.render_game()
         game_state.play_sounds()
         game_state.hide_cursor_while_playing()
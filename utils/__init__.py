@@ -4,7 +4,15 @@ from .helpers import *
 from .asset_manager import AssetManager
 from .pygame_helpers import *
 from .geometry import *
+from .frame_clock import FrameClock, frame_clock
 from .time_manager import *
+from .spatial_grid import SpatialGrid
+from .entity_store import EntityStore
+from .object_pool import ObjectPool, Pooled, pool_stats
+from .surface_cache import SurfaceCache
+from .dirty_rects import DirtyRectTracker, dirty_rects
+from .viewport import Viewport, viewport
+from .dot_batch import DotBatch, dot_batch
 
 # __all__ = [
 #     "AssetManager",
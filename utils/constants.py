@@ -33,6 +33,7 @@ ORANGE = (255, 140, 0)
 ACCELERATION = 0.3
 DECELERATION = 0.02
 ROTATE = 4.5
+ORIENTATION_STEPS = round(360 / ROTATE) # distinct orientations the user spaceship can face
 SPACESHIP_STARTING_LIVES = 3 #reset to 3
 
 # ANGLE CONVERSIONS
@@ -63,6 +64,14 @@ MAX_BULLETS = 100
 BULLET_SPEED = 20
 ENEMY_BULLET_SPEED = 5
 
+# OBJECT POOLS (most released instances kept for reuse, per class)
+BULLET_POOL_SIZE = MAX_BULLETS
+ASTEROID_POOL_SIZE = 64
+ANIMATION_POOL_SIZE = 32
+
+# PARTICLE SETTINGS
+PARTICLE_CAPACITY = 2048 # particles alive at once across all explosions; the oldest are dropped past this
+
 # ENEMY SPACESHIP SETTINGS
 BIG_ENEMY_SSHIP_SIZE = 45
 SMALL_ENEMY_SSHIP_SIZE = 25
@@ -75,6 +84,20 @@ MIN_SSHIP_DELTA_TIME = 300
 # ASTEROID SETTINGS
 SHORTEN_AST_DELTA_TIME = 3
 MIN_AST_DELTA_TIME = 400
+MAX_ASTEROID_SIZE = 150 # largest spawned asteroid; its vertices reach up to 1.5x this from the center
+
+# RENDER CACHES
+# pixel data kept for pre-rendered polygon sprites: a pool's worth of the largest asteroid sprites
+# (vertices at 1.5x size plus a 3px outline, 4 bytes a pixel). Sprites are dropped with their asteroid,
+# so what is actually held follows the asteroids alive.
+SPRITE_CACHE_BYTES = ASTEROID_POOL_SIZE * (2 * (int(MAX_ASTEROID_SIZE * 1.5) + 4)) ** 2 * 4
+TEXT_CACHE_BYTES = 8 * 1024 * 1024 # pixel data kept for rendered text
+TEXT_ELEMENT_CACHE_SIZE = 256 # DisplayText elements kept for reuse by Display.craft_element
+DIRTY_RECTS = False # only clear and push the regions drawn last frame and this frame
+DIRTY_RECT_FULL_UPDATE_RATIO = 0.4 # push the whole screen instead once the dirty area covers this much of it
+
+# COLLISION SETTINGS
+MIN_GRID_CELL_SIZE = 32 # lower bound for the broad-phase cell size, in pixels
 
 # GAME SETTINGS
 INITIAL_SPACESHIP_FIRE_DELTA_TIME = 500  # Increases
@@ -0,0 +1,93 @@
+import pygame as pg
+from .constants import DIRTY_RECTS, DIRTY_RECT_FULL_UPDATE_RATIO
+
+
+class DirtyRectTracker:
+    """
+    Opt-in dirty-rectangle rendering.
+
+    Everything drawn on the screen reports the Rect it touched through add(). Each frame the
+    background is only restored over what was drawn last frame, and pg.display.update is handed the
+    merged rects of last frame and this frame. When that area is over 'full_update_ratio' of the
+    screen, or after invalidate() (eg a state change or resolution change), the whole screen is
+    cleared and pushed instead.
+    """
+    def __init__(self, enabled=DIRTY_RECTS, full_update_ratio=DIRTY_RECT_FULL_UPDATE_RATIO):
+        self.enabled = enabled
+        self.full_update_ratio = full_update_ratio
+        self.previous = [] # rects drawn last frame
+        self.current = []  # rects drawn so far this frame
+        self.full_redraw = True
+        self.full_updates = 0 # frames pushed whole, for stats
+        self.partial_updates = 0
+
+    def add(self, rect):
+        """Record a Rect drawn this frame (the return value of blit or pg.draw.*)."""
+        if self.enabled and rect:
+            self.current.append(rect)
+        return rect
+
+    def extend(self, rects):
+        """Record several Rects drawn this frame (eg the return value of Surface.blits)."""
+        if self.enabled:
+            self.current.extend(filter(None, rects))
+
+    def invalidate(self):
+        """Force the next frame to be cleared and pushed whole."""
+        self.full_redraw = True
+
+    def clear(self, screen, color):
+        """Restore the background for this frame: only over last frame's drawings unless a full redraw is due."""
+        if self.full_redraw or not self.enabled:
+            screen.fill(color)
+            return
+        for rect in self.previous:
+            screen.fill(color, rect)
+
+    @staticmethod
+    def merge(rects) -> list:
+        """Union overlapping rects until none overlap."""
+        merged = []
+        for rect in rects:
+            rect = pg.Rect(rect)
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def end_frame(self, screen):
+        """
+        Push this frame to the display: the merged dirty rects, or the whole screen when that's cheaper or required.
+        """
+        if not self.enabled:
+            pg.display.update()
+            return
+        rects = None
+        if not self.full_redraw:
+            rects = self.merge(self.previous + self.current)
+            dirty_area = sum(rect.width * rect.height for rect in rects)
+            if dirty_area > self.full_update_ratio * screen.get_width() * screen.get_height():
+                rects = None
+        if rects is None:
+            pg.display.update()
+            self.full_updates += 1
+        else:
+            pg.display.update(rects)
+            self.partial_updates += 1
+        self.previous = self.current
+        self.current = []
+        self.full_redraw = False
+
+    def stats(self) -> dict:
+        frames = self.full_updates + self.partial_updates
+        return {
+            'enabled': self.enabled,
+            'full_updates': self.full_updates,
+            'partial_updates': self.partial_updates,
+            'partial_rate': self.partial_updates / frames if frames else 0
+        }
+
+
+dirty_rects = DirtyRectTracker()
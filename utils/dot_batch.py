@@ -0,0 +1,98 @@
+from itertools import repeat
+import numpy as np
+import pygame as pg
+from .dirty_rects import dirty_rects
+from .geometry import sprite_cache
+
+
+class DotBatch:
+    """
+    Per-frame batch of small filled circles (bullets and explosion particles).
+
+    Instead of a pg.draw.circle call per dot, dots are queued with add(), grouped by (color, radius),
+    and drawn by flush() from one pre-rendered sprite per group with a single Surface.blits call.
+    Sprites are placed where pg.draw.circle would put the circle (its center truncated to ints), so
+    the result is pixel-identical.
+    Queueing has to stay cheaper than the draw call it replaces. One dot at a time through add() only
+    breaks even with pg.draw.circle; the gain comes from add_many(), which takes many dots of one color
+    and radius as arrays (eg from the particle buffer or the entity store).
+    """
+    def __init__(self, sprites=sprite_cache):
+        self.sprites = sprites
+        self.groups = {} # (color, radius) -> top-left positions queued this frame; lists are reused between frames
+        self.drawn = 0   # dots drawn by the last flush, for stats
+
+    def __len__(self):
+        return sum(len(positions) for positions in self.groups.values())
+
+    def _positions(self, color, radius) -> list:
+        try:
+            return self.groups[(color, radius)]
+        except KeyError:
+            positions = self.groups[(color, radius)] = []
+            return positions
+
+    def add(self, x, y, radius, color):
+        """Queue a filled circle, as pg.draw.circle(screen, color, (x, y), radius) would draw it."""
+        radius = int(radius)
+        try:
+            positions = self.groups[(color, radius)]
+        except KeyError:
+            positions = self._positions(color, radius)
+        positions.append((int(x) - radius, int(y) - radius))
+
+    def add_many(self, xs, ys, radius, color):
+        """Queue dots of one radius and color centered on each (xs[i], ys[i])."""
+        radius = int(radius)
+        positions = self._positions(color, radius)
+        positions.extend(zip(
+            (np.asarray(xs).astype(int) - radius).tolist(),
+            (np.asarray(ys).astype(int) - radius).tolist()
+        ))
+
+    @staticmethod
+    def _rasterize(color, radius):
+        """Draw the dot once on a colorkeyed RLE surface, like Polygon sprites."""
+        surface = pg.Surface((2 * radius, 2 * radius))
+        colorkey = (0, 0, 0) if tuple(color[:3]) != (0, 0, 0) else (255, 255, 255)
+        surface.fill(colorkey)
+        pg.draw.circle(surface, color, (radius, radius), radius)
+        surface.set_colorkey(colorkey, pg.RLEACCEL)
+        if pg.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def sprite(self, color, radius):
+        key = ('dot', color, radius)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self._rasterize(color, radius)
+            self.sprites.put(key, sprite)
+        return sprite
+
+    def flush(self, screen):
+        """Draw every queued dot with one Surface.blits call and empty the batch."""
+        blit_sequence = []
+        for (color, radius), positions in self.groups.items():
+            if positions and radius > 0: # pg.draw.circle draws nothing below radius 1
+                blit_sequence.extend(zip(repeat(self.sprite(color, radius)), positions))
+            positions.clear()
+        if dirty_rects.enabled:
+            dirty_rects.extend(screen.blits(blit_sequence))
+        else:
+            screen.blits(blit_sequence, doreturn=False)
+        self.drawn = len(blit_sequence)
+
+    def clear(self):
+        """Drop queued dots without drawing them."""
+        for positions in self.groups.values():
+            positions.clear()
+
+    def stats(self) -> dict:
+        return {
+            'drawn': self.drawn,
+            'groups': len(self.groups)
+        }
+
+
+dot_batch = DotBatch()
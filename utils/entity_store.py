@@ -0,0 +1,127 @@
+import numpy as np
+from math import inf
+
+
+class EntityStore:
+    """
+    Structure-of-arrays storage for entities that only ever move in a straight line (asteroids, bullets).
+
+    Each attached entity owns one row (slot) of contiguous NumPy arrays, so moving every entity and
+    checking which ones should despawn is a handful of vectorized operations per tick instead of a
+    Python loop. Entities keep working as normal objects: see entities.ArrayBacked.
+    """
+    fields = ('x', 'y', 'prev_x', 'prev_y', 'vx', 'vy', 'radius', 'lifetime')
+
+    def __init__(self, capacity=256):
+        self.capacity = 0
+        for field in EntityStore.fields:
+            setattr(self, field, np.zeros(0))
+        self.bounded = np.zeros(0, dtype=bool) # despawn when the row leaves the screen
+        self.alive = np.zeros(0, dtype=bool)   # row is in use
+        self.handles = []
+        self.free_slots = []
+        self.high_water = 0 # rows at or above this index have never been handed out since the last reset
+        self.count = 0
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, capacity):
+        extra = capacity - self.capacity
+        for field in EntityStore.fields:
+            setattr(self, field, np.concatenate((getattr(self, field), np.zeros(extra))))
+        self.bounded = np.concatenate((self.bounded, np.zeros(extra, dtype=bool)))
+        self.alive = np.concatenate((self.alive, np.zeros(extra, dtype=bool)))
+        self.handles += [None] * extra
+        self.capacity = capacity
+
+    def _allocate(self, n) -> np.ndarray:
+        """Hand out n free rows, reusing released ones first."""
+        reused = [self.free_slots.pop() for _ in range(min(n, len(self.free_slots)))]
+        fresh = n - len(reused)
+        if self.high_water + fresh > self.capacity:
+            self._grow(max(self.capacity * 2, self.high_water + fresh))
+        slots = np.array(reused + list(range(self.high_water, self.high_water + fresh)), dtype=np.intp)
+        self.high_water += fresh
+        self.count += n
+        return slots
+
+    def attach(self, entity):
+        self.attach_many((entity,))
+
+    def attach_many(self, entities):
+        """
+        Move the kinematic state of several entities into the arrays with one write per field.
+        Entities without a lifetime never expire; entities with despawn_out_of_bounds set are dropped once off screen.
+        """
+        entities = [entity for entity in entities if entity._store is None]
+        if not entities:
+            return
+        slots = self._allocate(len(entities))
+        self.x[slots] = [entity.x for entity in entities]
+        self.y[slots] = [entity.y for entity in entities]
+        self.prev_x[slots] = [entity.prev_x if entity.swept else entity.x for entity in entities]
+        self.prev_y[slots] = [entity.prev_y if entity.swept else entity.y for entity in entities]
+        self.vx[slots] = [entity.vx for entity in entities]
+        self.vy[slots] = [entity.vy for entity in entities]
+        self.radius[slots] = [entity.size for entity in entities]
+        self.lifetime[slots] = [inf if entity.lifetime is None else entity.lifetime for entity in entities]
+        self.bounded[slots] = [entity.despawn_out_of_bounds for entity in entities]
+        self.alive[slots] = True
+        for slot, entity in zip(slots.tolist(), entities):
+            self.handles[slot] = entity
+            entity._slot = slot
+            entity._store = self
+
+    def detach(self, entity):
+        """Copy an entity's state back onto the entity and release its row."""
+        if entity._store is not self:
+            return
+        slot = entity._slot
+        state = {field: float(getattr(self, field)[slot]) for field in ('x', 'y', 'prev_x', 'prev_y', 'vx', 'vy', 'lifetime')}
+        entity._store = None
+        entity._slot = None
+        for field, value in state.items():
+            setattr(entity, field, value)
+        if entity.lifetime == inf:
+            entity.lifetime = None
+        self.alive[slot] = False
+        self.handles[slot] = None
+        self.count -= 1
+        if self.count == 0:
+            self.free_slots = []
+            self.high_water = 0
+        else:
+            self.free_slots.append(slot)
+
+    def clear(self):
+        for entity in self.handles[:self.high_water]:
+            if entity is not None:
+                self.detach(entity)
+
+    def step(self, screen_width, screen_height) -> list:
+        """
+        Advance every row by its velocity and count down lifetimes.
+
+        Returns:
+            list: The entities that should despawn this tick (lifetime ran out or left the screen).
+        """
+        n = self.high_water
+        if n == 0:
+            return []
+        x = self.x[:n]
+        y = self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        x += self.vx[:n]
+        y += self.vy[:n]
+        lifetime = self.lifetime[:n]
+        expired = lifetime <= 0
+        lifetime -= 1
+        radius = self.radius[:n]
+        out_of_bounds = self.bounded[:n] & (
+            (x < -radius) | (x > screen_width + radius) | (y < -radius) | (y > screen_height + radius)
+        )
+        despawned = np.flatnonzero(self.alive[:n] & (expired | out_of_bounds))
+        return [self.handles[slot] for slot in despawned.tolist()]
@@ -0,0 +1,51 @@
+from time import perf_counter
+
+
+class FrameClock:
+    """
+    The game's clock, in milliseconds like pg.time.get_ticks.
+
+    tick() samples perf_counter once per frame; everything that reads the time during the frame
+    (every TimeManager) then sees that same 'now' instead of querying the time again. Pause is
+    tracked here too, once for the whole game: 'game_time' is the time spent not paused, and
+    stands still while paused.
+    """
+    def __init__(self):
+        self.origin = perf_counter()
+        self.now = 0.0          # ms since the clock started, as of the last tick
+        self.frame = 0
+        self.paused = False
+        self.paused_since = 0.0
+        self.total_paused = 0.0 # ms spent paused, up to the last resume
+
+    def sample(self) -> float:
+        return (perf_counter() - self.origin) * 1000
+
+    def tick(self):
+        """Sample the time for this frame."""
+        self.now = self.sample()
+        self.frame += 1
+
+    @property
+    def paused_time(self) -> float:
+        if self.paused:
+            return self.total_paused + (self.now - self.paused_since)
+        return self.total_paused
+
+    @property
+    def game_time(self) -> float:
+        return self.now - self.paused_time
+
+    def set_paused(self, paused: bool):
+        """Pause or resume, from the current time rather than the frame's (the frame may have been long)."""
+        if paused == self.paused:
+            return
+        self.now = self.sample()
+        if paused:
+            self.paused_since = self.now
+        else:
+            self.total_paused += self.now - self.paused_since
+        self.paused = paused
+
+
+frame_clock = FrameClock()
@@ -2,6 +2,21 @@ import pygame as pg
 # import math
 from math import cos, sin, pi, hypot, atan2
 from abc import ABC, abstractmethod
+from itertools import count
+from .constants import ROTATE, ORIENTATION_STEPS, SPRITE_CACHE_BYTES
+from .surface_cache import SurfaceCache
+from .dirty_rects import dirty_rects
+
+
+def unit_vector(degrees) -> tuple:
+    """
+    (cos, sin) of an angle in degrees.
+    Not memoized: spaceship thrust and enemy aim produce arbitrary float angles, so a cache would mostly
+    miss. Entities call it only when their direction or speed changes (see SpaceEntity._update_velocity).
+    """
+    radians = degrees * pi / 180
+    return cos(radians), sin(radians)
+
 
 class Line: 
     def __init__(self, x0, y0, x1, y1, color):
@@ -28,15 +43,155 @@ class Line:
         self.x1 = self.center_x + dx
         self.y1 = self.center_y + dy
 
+    def move(self, dx, dy):
+        """Move the line by a certain offset."""
+        self.center_x += dx
+        self.center_y += dy
+        self.x0 += dx
+        self.y0 += dy
+        self.x1 += dx
+        self.y1 += dy
+
     def draw(self, surface):
-        pg.draw.line(
+        dirty_rects.add(pg.draw.line(
             surface,
             self.color,
             (self.x0, self.y0),
             (self.x1, self.y1),
             self.width
-        )
+        ))
+
+
+
+def convex_hull(points) -> list:
+    """Convex hull of a list of (x, y) points in counter-clockwise order (monotone chain)."""
+    points = sorted(set(map(tuple, points)))
+    if len(points) <= 2:
+        return points
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower = []
+    for point in points:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], point) <= 0:
+            lower.pop()
+        lower.append(point)
+    upper = []
+    for point in reversed(points):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], point) <= 0:
+            upper.pop()
+        upper.append(point)
+    return lower[:-1] + upper[:-1]
+
+
+def point_in_polygon(vertices, x, y) -> bool:
+    """Even-odd test of whether (x, y) lies inside a simple polygon."""
+    inside = False
+    x0, y0 = vertices[-1]
+    for x1, y1 in vertices:
+        if (y1 > y) != (y0 > y) and x < (x0 - x1) * (y - y1) / (y0 - y1) + x1:
+            inside = not inside
+        x0, y0 = x1, y1
+    return inside
+
+
+def segment_distance_squared(px, py, x0, y0, x1, y1) -> float:
+    """Squared distance from point (px, py) to the segment (x0, y0)-(x1, y1)."""
+    dx = x1 - x0
+    dy = y1 - y0
+    length_squared = dx * dx + dy * dy
+    if length_squared == 0:
+        t = 0
+    else:
+        t = max(0, min(1, ((px - x0) * dx + (py - y0) * dy) / length_squared))
+    ex = x0 + t * dx - px
+    ey = y0 + t * dy - py
+    return ex * ex + ey * ey
+
+
+def segments_intersect(ax0, ay0, ax1, ay1, bx0, by0, bx1, by1) -> bool:
+    """Check if segment a crosses segment b (touching counts)."""
+    def orientation(px, py, qx, qy, rx, ry):
+        return (qx - px) * (ry - py) - (qy - py) * (rx - px)
+
+    d1 = orientation(bx0, by0, bx1, by1, ax0, ay0)
+    d2 = orientation(bx0, by0, bx1, by1, ax1, ay1)
+    d3 = orientation(ax0, ay0, ax1, ay1, bx0, by0)
+    d4 = orientation(ax0, ay0, ax1, ay1, bx1, by1)
+    return ((d1 > 0) != (d2 > 0) or d1 == 0 or d2 == 0) and ((d3 > 0) != (d4 > 0) or d3 == 0 or d4 == 0)
+
+
+def segments_distance_squared(ax0, ay0, ax1, ay1, bx0, by0, bx1, by1) -> float:
+    """Squared distance between segment a and segment b."""
+    if segments_intersect(ax0, ay0, ax1, ay1, bx0, by0, bx1, by1):
+        return 0
+    return min(
+        segment_distance_squared(ax0, ay0, bx0, by0, bx1, by1),
+        segment_distance_squared(ax1, ay1, bx0, by0, bx1, by1),
+        segment_distance_squared(bx0, by0, ax0, ay0, ax1, ay1),
+        segment_distance_squared(bx1, by1, ax0, ay0, ax1, ay1)
+    )
+
+
+def polygon_circle_overlap(vertices, cx, cy, radius) -> bool:
+    """
+    Exact test of a simple polygon against a circle.
+    The circle overlaps if its centre is inside the polygon or any edge passes within 'radius' of it.
+    """
+    if point_in_polygon(vertices, cx, cy):
+        return True
+    radius_squared = radius * radius
+    x0, y0 = vertices[-1]
+    for x1, y1 in vertices:
+        if segment_distance_squared(cx, cy, x0, y0, x1, y1) < radius_squared:
+            return True
+        x0, y0 = x1, y1
+    return False
+
 
+def polygon_capsule_overlap(vertices, x0, y0, x1, y1, radius) -> bool:
+    """
+    Exact test of a simple polygon against a circle swept from (x0, y0) to (x1, y1).
+    Used for fast movers so they can't tunnel through thin shapes between two frames.
+    """
+    if x0 == x1 and y0 == y1:
+        return polygon_circle_overlap(vertices, x1, y1, radius)
+    if point_in_polygon(vertices, x1, y1):
+        return True
+    radius_squared = radius * radius
+    ex0, ey0 = vertices[-1]
+    for ex1, ey1 in vertices:
+        if segments_distance_squared(x0, y0, x1, y1, ex0, ey0, ex1, ey1) < radius_squared:
+            return True
+        ex0, ey0 = ex1, ey1
+    return False
+
+
+def convex_polygons_overlap(hull_a, hull_b, offset_x=0, offset_y=0) -> bool:
+    """
+    Separating axis test for two convex polygons.
+
+    Args:
+        hull_a (list): Vertices of the first polygon.
+        hull_b (list): Vertices of the second polygon, in a frame shifted by (offset_x, offset_y) from hull_a's.
+    """
+    for hull in (hull_a, hull_b):
+        x0, y0 = hull[-1]
+        for x1, y1 in hull:
+            axis_x = y0 - y1
+            axis_y = x1 - x0
+            x0, y0 = x1, y1
+            projections_a = [axis_x * x + axis_y * y for x, y in hull_a]
+            shift = axis_x * offset_x + axis_y * offset_y
+            projections_b = [axis_x * x + axis_y * y + shift for x, y in hull_b]
+            if max(projections_a) <= min(projections_b) or max(projections_b) <= min(projections_a):
+                return False
+    return True
+
+
+# outline sprites of every cacheable polygon, keyed (sprite_id, color, width)
+sprite_cache = SurfaceCache(SPRITE_CACHE_BYTES)
 
 
 class Polygon(ABC):
@@ -45,23 +200,108 @@ class Polygon(ABC):
         self.center_y = center_y
         self.color = color
         self.width = width
+        self._local_hull = None
+        self._local_hull_key = None
+        self._vertex_buffer = None
     
     @property
     @abstractmethod
     def vertices(self):
         """Calculate vertices of the polygon."""
         pass
+
+    def _translate(self, offsets) -> list:
+        """
+        Write local vertices moved to the polygon's center into a buffer reused by every call.
+        The returned list is overwritten by the next call, so copy it to keep it.
+        """
+        buffer = self._vertex_buffer
+        if buffer is None or len(buffer) != len(offsets):
+            buffer = self._vertex_buffer = [[0.0, 0.0] for _ in offsets]
+        center_x = self.center_x
+        center_y = self.center_y
+        for vertex, (offset_x, offset_y) in zip(buffer, offsets):
+            vertex[0] = center_x + offset_x
+            vertex[1] = center_y + offset_y
+        return buffer
+
+    @property
+    def local_vertices(self) -> list:
+        """Vertices relative to the polygon's center."""
+        return [(x - self.center_x, y - self.center_y) for x, y in self.vertices]
+
+    @property
+    def max_radius(self) -> float:
+        """Distance from the center to the furthest vertex."""
+        return max(hypot(x, y) for x, y in self.local_vertices)
+
+    @property
+    def shape_key(self):
+        """Changes whenever the local-space shape changes (eg rotation), so cached geometry can be rebuilt."""
+        return None
+
+    @property
+    def local_hull(self) -> list:
+        """Convex hull of the local vertices, cached until shape_key changes."""
+        key = self.shape_key
+        if self._local_hull is None or key != self._local_hull_key:
+            self._local_hull = convex_hull(self.local_vertices)
+            self._local_hull_key = key
+        return self._local_hull
+
+    @property
+    def collision_outline(self) -> list:
+        """Local-space outline used for exact polygon-vs-circle tests. Must be a simple polygon."""
+        return self.local_vertices
     
+    @property
+    def sprite_id(self):
+        """
+        Identifies the local-space shape for the sprite cache, or None to draw with pg.draw.polygon every frame.
+        Must change whenever local_vertices change.
+        """
+        return None
+
+    def _rasterize(self):
+        """Draw the outline once, centered on a colorkeyed surface (RLE colorkey blits much faster than per-pixel alpha)."""
+        half_size = int(self.max_radius) + self.width + 1
+        surface = pg.Surface((2 * half_size, 2 * half_size))
+        colorkey = (0, 0, 0) if tuple(self.color[:3]) != (0, 0, 0) else (255, 255, 255)
+        surface.fill(colorkey)
+        pg.draw.polygon(surface, self.color, [(x + half_size, y + half_size) for x, y in self.local_vertices], self.width)
+        surface.set_colorkey(colorkey, pg.RLEACCEL)
+        if pg.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
     def render(self, screen):
-        """Draw the polygon on the given screen."""
-        pg.draw.polygon(screen, self.color, self.vertices, self.width)
+        """Draw the polygon on the given screen, blitting its cached sprite when it has one."""
+        sprite_id = self.sprite_id
+        if sprite_id is None:
+            dirty_rects.add(pg.draw.polygon(screen, self.color, self.vertices, self.width))
+            return
+        key = (sprite_id, self.color, self.width)
+        sprite = sprite_cache.get(key)
+        if sprite is None:
+            sprite = self._rasterize()
+            sprite_cache.put(key, sprite)
+        half_size = sprite.get_width() // 2
+        dirty_rects.add(screen.blit(sprite, (round(self.center_x) - half_size, round(self.center_y) - half_size)))
     
+    def discard_sprite(self):
+        """Drop this polygon's cached sprite, for polygons whose sprite no other polygon shares."""
+        sprite_id = self.sprite_id
+        if sprite_id is not None:
+            sprite_cache.discard((sprite_id, self.color, self.width))
+
     def move(self, dx, dy):
         """Move the polygon by a certain offset."""
         self.center_x += dx
         self.center_y += dy
         
 class RandomPolygon(Polygon):
+    _shape_ids = count() # every shape (and reshape) gets a fresh sprite id
+
     def __init__(self, center_x, center_y, base_radius, sides, color, width, radii=None):
         super().__init__(center_x, center_y, color, width)
         """
@@ -79,107 +319,204 @@ class RandomPolygon(Polygon):
         self.sides = sides
         self.base_radius = base_radius
         self.radii = radii or [base_radius] * sides
+        self.offsets = [[0.0, 0.0] for _ in range(sides)] # local-space vertices
+        self._cache_offsets()
+
+    def _cache_offsets(self):
+        """Precompute the local-space vertices, which only change when the polygon is reshaped."""
+        for i, radius in enumerate(self.radii):
+            unit_x, unit_y = unit_vector(i * 360 / self.sides)
+            offset = self.offsets[i]
+            offset[0] = radius * unit_x
+            offset[1] = radius * unit_y
+        self._max_radius = max(self.radii)
+        self._local_hull = None
+        self._shape_id = next(self._shape_ids)
+
+    def reshape(self, center_x, center_y, base_radius, color, radii):
+        """Reuse this polygon for a new shape (eg a recycled asteroid)."""
+        self.discard_sprite() # nothing draws the old shape anymore
+        self.center_x = center_x
+        self.center_y = center_y
+        self.base_radius = base_radius
+        self.color = color
+        self.radii = radii
+        self._cache_offsets()
 
     @property
     def vertices(self):
-        """Calculate vertices of the polygon with varying radii."""
-        angle_increment = 2 * pi / self.sides
-        vertices = []
-        for i in range(self.sides):
-            angle = i * angle_increment
-            radius = self.radii[i]
-            x = self.center_x + radius * cos(angle)
-            y = self.center_y + radius * sin(angle)
-            vertices.append((x, y))
-        return vertices
+        """Translate the cached local vertices to the polygon's center."""
+        return self._translate(self.offsets)
+
+    @property
+    def local_vertices(self):
+        return self.offsets
 
+    @property
+    def max_radius(self):
+        """Distance from the center to the furthest vertex, cached with the offsets."""
+        return self._max_radius
+
+    @property
+    def sprite_id(self):
+        return (RandomPolygon, self._shape_id)
 
 
 class UserSpaceshipPolygon(Polygon):
+    # local vertices per (size, orientation step), shared by every instance: the ship only rotates in ROTATE steps
+    _offset_table = {}
+
     def __init__(self, center_x, center_y, color, width, size, orientation):
         super().__init__(center_x, center_y, color, width)
         self.size = size
         self.orientation = orientation
 
     @property
-    def vertices(self):
-        """Calculate vertices of the polygon with specific radii to form the spaceship 'A' shape."""
+    def max_radius(self):
+        return self.size * 1.4
+
+    @property
+    def orientation_step(self) -> int:
+        """Orientation quantized to the nearest multiple of ROTATE."""
+        return round(self.orientation / ROTATE) % ORIENTATION_STEPS
+
+    @property
+    def shape_key(self):
+        return self.orientation_step
+
+    @property
+    def sprite_id(self):
+        return (type(self), self.size, self.orientation_step)
+
+    @classmethod
+    def _compute_offsets(cls, size, orientation) -> tuple:
+        """Calculate local vertices with specific radii to form the spaceship 'A' shape."""
         #define coordinate for front of spacecraft
-        x_front = self.center_x + (self.size * cos(pi / 180 * (self.orientation - 90) ))
-        y_front = self.center_y + (self.size * sin(pi / 180 * (self.orientation - 90) ))
+        x_front = size * cos(pi / 180 * (orientation - 90))
+        y_front = size * sin(pi / 180 * (orientation - 90))
 
         #define coordinate for back right of spacecraft
-        x_backright = self.center_x + ((self.size * .8) * cos(pi / 180 * (140 + 15 + self.orientation - 90) ))
-        y_backright = self.center_y + ((self.size * .8) * sin(pi / 180 * (140 + 15 + self.orientation - 90) ))
+        x_backright = (size * .8) * cos(pi / 180 * (140 + 15 + orientation - 90))
+        y_backright = (size * .8) * sin(pi / 180 * (140 + 15 + orientation - 90))
   
         #define coordinate for back left of spacecraft
-        x_backleft = self.center_x + ((self.size * .8) * cos(pi / 180 * (220 - 15 + self.orientation - 90) ))
-        y_backleft = self.center_y + ((self.size * .8) * sin(pi / 180 * (220 - 15 + self.orientation - 90) ))
+        x_backleft = (size * .8) * cos(pi / 180 * (220 - 15 + orientation - 90))
+        y_backleft = (size * .8) * sin(pi / 180 * (220 - 15 + orientation - 90))
         
         #define coordinate for back right of spacecraft
-        x_endright = self.center_x + ((self.size * 1.4) * cos(pi / 180 * (140 + 20 + self.orientation - 90) ))
-        y_endright = self.center_y + ((self.size * 1.4) * sin(pi / 180 * (140 + 20 + self.orientation - 90) ))
+        x_endright = (size * 1.4) * cos(pi / 180 * (140 + 20 + orientation - 90))
+        y_endright = (size * 1.4) * sin(pi / 180 * (140 + 20 + orientation - 90))
   
         #define coordinate for back left of spacecraft
-        x_endleft = self.center_x + ((self.size * 1.4) * cos(pi / 180 * (220 - 20 + self.orientation - 90) ))
-        y_endleft = self.center_y + ((self.size * 1.4) * sin(pi / 180 * (220 - 20 + self.orientation - 90) ))    
+        x_endleft = (size * 1.4) * cos(pi / 180 * (220 - 20 + orientation - 90))
+        y_endleft = (size * 1.4) * sin(pi / 180 * (220 - 20 + orientation - 90))
         
-        return [(x_front, y_front), (x_endright, y_endright), (x_backright, y_backright), (x_backleft, y_backleft), (x_endleft, y_endleft)] 
+        return ((x_front, y_front), (x_endright, y_endright), (x_backright, y_backright), (x_backleft, y_backleft), (x_endleft, y_endleft))
+
+    @property
+    def local_vertices(self):
+        """Look up the local vertices for this size and orientation step, computing them on first use."""
+        key = (self.size, self.orientation_step)
+        offsets = self._offset_table.get(key)
+        if offsets is None:
+            offsets = self._offset_table[key] = self._compute_offsets(self.size, key[1] * ROTATE)
+        return offsets
+
+    @property
+    def vertices(self):
+        return self._translate(self.local_vertices)
         
 
 class RocketPolygon(UserSpaceshipPolygon):
+    _offset_table = {}
+
     def __init__(self, center_x, center_y, color, width, size, orientation):
         super().__init__(center_x, center_y, color, width, size, orientation)
     
-    @property
-    def vertices(self):
+    @classmethod
+    def _compute_offsets(cls, size, orientation) -> tuple:
         # tip
-        x_rocket = self.center_x + ((self.size * 1.4) * cos(pi / 180 * (180 + self.orientation - 90) ))
-        y_rocket = self.center_y + ((self.size * 1.4) * sin(pi / 180 * (180 + self.orientation - 90) ))
+        x_rocket = (size * 1.4) * cos(pi / 180 * (180 + orientation - 90))
+        y_rocket = (size * 1.4) * sin(pi / 180 * (180 + orientation - 90))
         # 
-        x_rocketleft = self.center_x + ((self.size * .8) * cos(pi / 180 * (180 + 20 + self.orientation - 90) ))
-        y_rocketleft = self.center_y + ((self.size * .8) * sin(pi / 180 * (180 + 20 + self.orientation - 90) ))    
+        x_rocketleft = (size * .8) * cos(pi / 180 * (180 + 20 + orientation - 90))
+        y_rocketleft = (size * .8) * sin(pi / 180 * (180 + 20 + orientation - 90))
         # 
-        x_rocketright = self.center_x + ((self.size * .8) * cos(pi / 180 * (180 - 20 + self.orientation - 90) ))
-        y_rocketright = self.center_y + ((self.size * .8) * sin(pi / 180 * (180 - 20 + self.orientation - 90) ))
-        return [(x_rocket, y_rocket), (x_rocketleft, y_rocketleft), (x_rocketright, y_rocketright)]
+        x_rocketright = (size * .8) * cos(pi / 180 * (180 - 20 + orientation - 90))
+        y_rocketright = (size * .8) * sin(pi / 180 * (180 - 20 + orientation - 90))
+        return ((x_rocket, y_rocket), (x_rocketleft, y_rocketleft), (x_rocketright, y_rocketright))
 
 
 class EnemySpaceshipPolygon(Polygon):
+    # flyweight: one local-space template (and hull) per ship size, shared by every enemy spaceship
+    _offset_table = {}
+    _hull_table = {}
+
     def __init__(self, center_x, center_y, color, width, size):
         super().__init__(center_x, center_y, color, width)
         self.size = size
         # self.orientation = 0
-        
+
     @property
-    def vertices(self):
+    def max_radius(self):
+        return self.size
+
+    @property
+    def collision_outline(self):
+        # the drawn vertex list retraces itself, so collide against the hull instead
+        return self.local_hull
+
+    @property
+    def sprite_id(self):
+        return (EnemySpaceshipPolygon, self.size)
+
+    @property
+    def local_hull(self):
+        hull = self._hull_table.get(self.size)
+        if hull is None:
+            hull = self._hull_table[self.size] = convex_hull(self.local_vertices)
+        return hull
+
+    @staticmethod
+    def _compute_offsets(size) -> tuple:
         #LEFT
         #1,2,3,4
-        xL1 = self.center_x + (self.size * .9 * cos(pi / 180 * (350 +  - 90) ))
-        yL1 = self.center_y + (self.size * .9 * sin(pi / 180 * (350 +  - 90) ))
+        xL1 = size * .9 * cos(pi / 180 * (350 +  - 90))
+        yL1 = size * .9 * sin(pi / 180 * (350 +  - 90))
 
 
-        xL2 = self.center_x + (self.size * .6 * cos(pi / 180 * (360 - 45 +  - 90) ))
-        yL2 = self.center_y + (self.size * .6 * sin(pi / 180 * (360 - 45 +  - 90) ))
+        xL2 = size * .6 * cos(pi / 180 * (360 - 45 +  - 90))
+        yL2 = size * .6 * sin(pi / 180 * (360 - 45 +  - 90))
 
-        xL3 = self.center_x + (self.size * 1 * cos(pi / 180 * (270 +  - 90) ))
-        yL3 = self.center_y + (self.size * 1 * sin(pi / 180 * (270 +  - 90) ))
+        xL3 = size * 1 * cos(pi / 180 * (270 +  - 90))
+        yL3 = size * 1 * sin(pi / 180 * (270 +  - 90))
 
-        xL4 = self.center_x + (self.size * .8 * cos(pi / 180 * (225 +  - 90) ))
-        yL4 = self.center_y + (self.size * .8 * sin(pi / 180 * (225 +  - 90) ))
+        xL4 = size * .8 * cos(pi / 180 * (225 +  - 90))
+        yL4 = size * .8 * sin(pi / 180 * (225 +  - 90))
 
         #RIGHT
-        xR1 = self.center_x + (self.size * .9 * cos(pi / 180 * (10 +  - 90) ))
-        yR1 = self.center_y + (self.size * .9 * sin(pi / 180 * (10 +  - 90) ))
+        xR1 = size * .9 * cos(pi / 180 * (10 +  - 90))
+        yR1 = size * .9 * sin(pi / 180 * (10 +  - 90))
 
 
-        xR2 = self.center_x + (self.size * .6 * cos(pi / 180 * (45 +  - 90) ))
-        yR2 = self.center_y + (self.size * .6 * sin(pi / 180 * (45 +  - 90) ))
+        xR2 = size * .6 * cos(pi / 180 * (45 +  - 90))
+        yR2 = size * .6 * sin(pi / 180 * (45 +  - 90))
 
-        xR3 = self.center_x + (self.size * 1 * cos(pi / 180 * (90 +  - 90) ))
-        yR3 = self.center_y + (self.size * 1 * sin(pi / 180 * (90 +  - 90) ))
+        xR3 = size * 1 * cos(pi / 180 * (90 +  - 90))
+        yR3 = size * 1 * sin(pi / 180 * (90 +  - 90))
 
-        xR4 = self.center_x + (self.size * .8 * cos(pi / 180 * (135 +  - 90) ))
-        yR4 = self.center_y + (self.size * .8 * sin(pi / 180 * (135 +  - 90) ))
+        xR4 = size * .8 * cos(pi / 180 * (135 +  - 90))
+        yR4 = size * .8 * sin(pi / 180 * (135 +  - 90))
 
-        return [(xL1,yL1), (xL2,yL2), (xR2,yR2), (xL2,yL2), (xL3,yL3), (xR3,yR3), (xL3,yL3), (xL4,yL4), (xR4,yR4), (xR3,yR3), (xR2,yR2), (xR1,yR1)]
+        return ((xL1,yL1), (xL2,yL2), (xR2,yR2), (xL2,yL2), (xL3,yL3), (xR3,yR3), (xL3,yL3), (xL4,yL4), (xR4,yR4), (xR3,yR3), (xR2,yR2), (xR1,yR1))
+
+    @property
+    def local_vertices(self):
+        offsets = self._offset_table.get(self.size)
+        if offsets is None:
+            offsets = self._offset_table[self.size] = self._compute_offsets(self.size)
+        return offsets
+
+    @property
+    def vertices(self):
+        return self._translate(self.local_vertices)
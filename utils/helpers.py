@@ -1,6 +1,6 @@
 from random import choice
-from .constants import WHITE, YELLOW, ORANGE, RED, GREEN, BLUE, PURPLE, Y_SCRNSIZE, DEG2RAD, RAD2DEG
-from pygame import display
+from .constants import WHITE, YELLOW, ORANGE, RED, GREEN, BLUE, PURPLE, DEG2RAD, RAD2DEG
+from .viewport import viewport
 from math import atan, radians, cos, sin
 
 def load_from_file(filepath):
@@ -42,8 +42,10 @@ class flicker:
         return result
     
      
-def translate_to_ratio(raw_val: int, scale_val=800, screen_size=Y_SCRNSIZE) -> int:
-    _, screen_size = display.get_window_size()
+def translate_to_ratio(raw_val: int, scale_val=800, screen_size=None) -> int:
+    """Scale a size designed for an 800px tall window to 'screen_size' (the current window height if None)."""
+    if screen_size is None:
+        screen_size = viewport.height
     return int((raw_val/scale_val) * screen_size)
 
 
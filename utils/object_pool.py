@@ -0,0 +1,69 @@
+class ObjectPool:
+    """
+    Free list of released instances of one class.
+
+    Keeps at most 'max_size' released instances (the high-water mark); anything released
+    beyond that is left to the garbage collector.
+    """
+    pools = [] # every pool created, for pool_stats
+
+    def __init__(self, cls, max_size):
+        self.cls = cls
+        self.max_size = max_size
+        self.free = []
+        self.hits = 0     # acquires served from the free list
+        self.misses = 0   # acquires that had to allocate
+        self.dropped = 0  # releases past the high-water mark
+        ObjectPool.pools.append(self)
+
+    def acquire(self):
+        """Get an uninitialised instance, recycled if possible. The caller is responsible for initialising it."""
+        if self.free:
+            self.hits += 1
+            return self.free.pop()
+        self.misses += 1
+        return object.__new__(self.cls)
+
+    def release(self, obj):
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+        else:
+            self.dropped += 1
+
+    def stats(self) -> dict:
+        acquires = self.hits + self.misses
+        return {
+            'free': len(self.free),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'dropped': self.dropped,
+            'hit_rate': self.hits / acquires if acquires else 0
+        }
+
+
+class Pooled:
+    """
+    Mixin that recycles instances through a per-class ObjectPool.
+
+    Constructing a subclass acquires an instance from its pool (then __init__ re-initialises it as usual),
+    and release() hands it back once nothing refers to it anymore. Each subclass gets its own pool,
+    sized by its 'pool_size'.
+    """
+    pool_size = 64
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.pool = ObjectPool(cls, cls.pool_size)
+
+    def __new__(cls, *args, **kwargs):
+        return cls.pool.acquire()
+
+    def release(self):
+        """Return this instance to its pool. It must not be used again until re-acquired."""
+        type(self).pool.release(self)
+
+
+def pool_stats() -> dict:
+    """Counters of every object pool, by class name."""
+    return {pool.cls.__name__: pool.stats() for pool in ObjectPool.pools}
@@ -0,0 +1,156 @@
+from math import inf
+
+
+class SpatialGrid:
+    """
+    Uniform spatial hash used as a broad phase for collision and proximity queries.
+
+    Every object is registered under a group key (eg 'asteroids') in each cell that its
+    bounding box overlaps, so a query only has to look at the cells its own box touches.
+    Objects flagged alive = False are skipped by queries, so removals don't need to touch the grid.
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}    # (cell_x, cell_y) -> {group: [objects]}
+        self.count = 0 # objects inserted since the last clear
+        self.extent = None # (min_cell_x, min_cell_y, max_cell_x, max_cell_y) of every cell ever filled since clear
+
+    def __len__(self):
+        return self.count
+
+    def clear(self, cell_size=None):
+        """Remove every object, optionally switching to a new cell size."""
+        if cell_size:
+            self.cell_size = cell_size
+        self.cells = {}
+        self.count = 0
+        self.extent = None
+
+    def _cell_range(self, bounds):
+        min_x, min_y, max_x, max_y = bounds
+        cell_size = self.cell_size
+        return (
+            int(min_x // cell_size),
+            int(min_y // cell_size),
+            int(max_x // cell_size),
+            int(max_y // cell_size)
+        )
+
+    def insert(self, obj, group, bounds):
+        """
+        Register an object in every cell overlapped by its bounding box.
+
+        Args:
+            obj: The object to store.
+            group (str): The group the object belongs to, used to filter queries.
+            bounds (tuple): (min_x, min_y, max_x, max_y) of the object.
+        """
+        x0, y0, x1, y1 = self._cell_range(bounds)
+        if self.extent is None:
+            self.extent = (x0, y0, x1, y1)
+        else:
+            ex0, ey0, ex1, ey1 = self.extent
+            self.extent = (min(x0, ex0), min(y0, ey0), max(x1, ex1), max(y1, ey1))
+        cells = self.cells
+        for cell_x in range(x0, x1 + 1):
+            for cell_y in range(y0, y1 + 1):
+                key = (cell_x, cell_y)
+                cell = cells.get(key)
+                if cell is None:
+                    cell = cells[key] = {}
+                members = cell.get(group)
+                if members is None:
+                    members = cell[group] = []
+                members.append(obj)
+        self.count += 1
+
+    def query(self, bounds, group) -> list:
+        """
+        Get the objects of 'group' that share at least one cell with 'bounds'.
+
+        Returns:
+            list: Each candidate exactly once, in insertion order.
+        """
+        x0, y0, x1, y1 = self._cell_range(bounds)
+        cells = self.cells
+        if x0 == x1 and y0 == y1:
+            cell = cells.get((x0, y0))
+            return [obj for obj in cell.get(group, ()) if obj.alive] if cell else []
+        found = {}
+        for cell_x in range(x0, x1 + 1):
+            for cell_y in range(y0, y1 + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell:
+                    for obj in cell.get(group, ()):
+                        if obj.alive:
+                            found[obj] = None
+        return list(found)
+
+    def _ring(self, cell_x, cell_y, ring):
+        """Yield the keys of the cells exactly 'ring' cells away (Chebyshev distance) from a cell."""
+        if ring == 0:
+            yield (cell_x, cell_y)
+            return
+        for x in range(cell_x - ring, cell_x + ring + 1):
+            yield (x, cell_y - ring)
+            yield (x, cell_y + ring)
+        for y in range(cell_y - ring + 1, cell_y + ring):
+            yield (cell_x - ring, y)
+            yield (cell_x + ring, y)
+
+    def nearest(self, x, y, groups, max_radius=None):
+        """
+        Find the object whose centre is closest to (x, y).
+
+        Searches outwards ring by ring from the cell containing (x, y) and stops as soon as no
+        unvisited cell can hold anything closer than the best match so far.
+
+        Args:
+            x, y (float): The query point.
+            groups (tuple): Groups to consider, eg ('asteroids',).
+            max_radius (float, optional): Ignore objects further away than this.
+
+        Returns:
+            The nearest object, or None if nothing is in range.
+        """
+        if self.extent is None:
+            return None
+        cell_size = self.cell_size
+        cell_x = int(x // cell_size)
+        cell_y = int(y // cell_size)
+        ex0, ey0, ex1, ey1 = self.extent
+        max_ring = max(cell_x - ex0, ex1 - cell_x, cell_y - ey0, ey1 - cell_y, 0)
+        best = None
+        best_distance_squared = inf if max_radius is None else max_radius * max_radius
+        seen = set()
+        cells = self.cells
+        for ring in range(max_ring + 1):
+            # every cell in this ring is at least (ring - 1) cells away from (x, y)
+            ring_distance = max(0, ring - 1) * cell_size
+            if ring_distance * ring_distance >= best_distance_squared:
+                break
+            for key in self._ring(cell_x, cell_y, ring):
+                cell = cells.get(key)
+                if not cell:
+                    continue
+                for group in groups:
+                    for obj in cell.get(group, ()):
+                        if obj in seen or not obj.alive:
+                            continue
+                        seen.add(obj)
+                        distance_squared = (obj.x - x) ** 2 + (obj.y - y) ** 2
+                        if distance_squared < best_distance_squared:
+                            best = obj
+                            best_distance_squared = distance_squared
+        return best
+
+    def within(self, x, y, radius, groups) -> list:
+        """Get every object of 'groups' whose centre lies within 'radius' of (x, y)."""
+        radius_squared = radius * radius
+        bounds = (x - radius, y - radius, x + radius, y + radius)
+        return [
+            obj
+            for group in groups
+            for obj in self.query(bounds, group)
+            if (obj.x - x) ** 2 + (obj.y - y) ** 2 <= radius_squared
+        ]
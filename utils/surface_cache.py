@@ -0,0 +1,81 @@
+from collections import OrderedDict
+
+
+class SurfaceCache:
+    """
+    Bounded LRU cache of pre-rendered pygame Surfaces.
+
+    Entries are evicted least-recently-used first once the pixel data held goes over 'max_bytes'.
+    Converted surfaces are tied to the display's pixel format, so clear the cache whenever the
+    display mode changes (eg toggle_fullscreen).
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict() # key -> Surface, least recently used first
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    @staticmethod
+    def surface_bytes(surface) -> int:
+        return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+    def get(self, key):
+        """Return the cached surface for 'key' (marking it most recently used), or None."""
+        surface = self.entries.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return surface
+
+    def get_or_create(self, key, factory):
+        """Return the cached surface for 'key', rendering and caching it with factory() on a miss."""
+        surface = self.get(key)
+        if surface is None:
+            surface = factory()
+            self.put(key, surface)
+        return surface
+
+    def put(self, key, surface):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes -= self.surface_bytes(old)
+        self.entries[key] = surface
+        self.bytes += self.surface_bytes(surface)
+        # always keep the newest entry, even if it alone is over budget
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= self.surface_bytes(evicted)
+            self.evictions += 1
+
+    def discard(self, key):
+        """Drop the surface for 'key' if cached (eg once nothing can draw it again)."""
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes -= self.surface_bytes(old)
+
+    def clear(self):
+        """Drop every surface (eg after a resolution change). Stats are kept."""
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0
+        }
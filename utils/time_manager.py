@@ -1,64 +1,48 @@
-import pygame as pg
+from weakref import WeakSet
+from .frame_clock import frame_clock
 
 class TimeManager:
+    """
+    Timer reading the shared frame_clock: its times don't count time spent paused.
+    'paused' mirrors frame_clock.paused; change it with toggle_pause / set_paused so the clock keeps count.
+    """
     paused = False
-    instances = []
-    
+    instances = WeakSet() # live timers; weak so timers dropped by their owners don't pile up here
+
     def __init__(self, delta_time):
         self.delta_time = delta_time
-        self.start_time = pg.time.get_ticks()
+        self.start_time = frame_clock.game_time
         self.prev_time = 0
-        self.already_set_start_paused_time = False
-        self.prev_tot_paused_time = 0
-        TimeManager.instances.append(self)
-        
+        TimeManager.instances.add(self)
+
     @property
     def total_time(self):
-        return pg.time.get_ticks()
-        
+        return frame_clock.now
+
     @property
     def current_time(self):
-        return pg.time.get_ticks() - self.paused_time - self.start_time
-    
+        return frame_clock.game_time - self.start_time
+
     @property
     def elapsed_time(self):
         return self.current_time - self.prev_time
-    
-    @property
-    def paused_time(self):
-        if TimeManager.paused:
-            if not self.already_set_start_paused_time:
-                self.start_paused_time = self.total_time
-                self.already_set_start_paused_time = True
-            return self.prev_tot_paused_time + (self.total_time - self.start_paused_time)
-        if self.already_set_start_paused_time:
-            self.prev_tot_paused_time += (self.total_time - self.start_paused_time)
-            self.already_set_start_paused_time = False
-        return self.prev_tot_paused_time
-        
+
     def check_delta_time_elapsed(self) -> bool:
-        if self.elapsed_time >= self.delta_time:
-            self.prev_time = self.current_time
+        current_time = self.current_time
+        if current_time - self.prev_time >= self.delta_time:
+            self.prev_time = current_time
             return True
         return False
-    
-    def update(self):
-        # simply calling the property self.paused_time allows everything to sync and detect properly, 
-        # and the self.prev_tot_paused_time to save properly
-        _ = self.paused_time
 
     @classmethod
-    def toggle_pause(cls):
-        cls.paused = not cls.paused
-        TimeManager.update_instances()
-        # problem: all time managers never even update during pause, since none of the attributes are called and check_delta_time_elapsed isn't called
-        # safest way to do this is to update all instances once when toggling paused.
-        
+    def set_paused(cls, paused: bool):
+        frame_clock.set_paused(paused)
+        cls.paused = paused
+
     @classmethod
-    def update_instances(cls):
-        for instance in cls.instances:
-            instance.update()
-            
+    def toggle_pause(cls):
+        cls.set_paused(not cls.paused)
+
     @classmethod
     def clear_instances(cls):
-        cls.instances = []
\ No newline at end of file
+        cls.instances = WeakSet()
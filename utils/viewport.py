@@ -0,0 +1,47 @@
+import pygame as pg
+from .constants import X_SCRNSIZE, Y_SCRNSIZE
+
+
+class Viewport:
+    """
+    The window size, read from pygame once per frame (and on resize / fullscreen) instead of by every
+    entity and UI element that needs it.
+
+    The size is stored and replaced as one (width, height) pair, falling back to the configured
+    screen size as a whole, so width and height can't come from different sources.
+    'version' is bumped whenever the size changes, for caches keyed on it.
+    """
+    default_size = (X_SCRNSIZE, Y_SCRNSIZE)
+
+    def __init__(self):
+        self.size = self.default_size
+        self.version = 0
+        self.update()
+
+    @property
+    def width(self) -> int:
+        return self.size[0]
+
+    @property
+    def height(self) -> int:
+        return self.size[1]
+
+    def circle_visible(self, x, y, radius) -> bool:
+        """Whether a circle's bounding box overlaps the window, ie whether drawing it could touch a pixel."""
+        width, height = self.size
+        return -radius < x < width + radius and -radius < y < height + radius
+
+    def update(self) -> bool:
+        """Re-read the window size. Returns whether it changed."""
+        try:
+            size = tuple(pg.display.get_window_size())
+        except pg.error:
+            size = self.default_size
+        if size == self.size:
+            return False
+        self.size = size
+        self.version += 1
+        return True
+
+
+viewport = Viewport()